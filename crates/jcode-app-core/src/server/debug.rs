@@ -427,8 +427,12 @@ pub(super) async fn handle_debug_client(
                     }
                     _ => {
                         // Server commands (default)
-                        if let Some(output) = maybe_handle_job_command(cmd, &debug_jobs).await? {
-                            Ok(output)
+                        // Job command errors (unknown id, job_wait timeout) are
+                        // answered on the wire instead of closing the connection.
+                        if let Some(result) =
+                            maybe_handle_job_command(cmd, &debug_jobs).await.transpose()
+                        {
+                            result
                         } else if let Some(output) = maybe_handle_session_admin_command(
                             cmd,
                             &sessions,
@@ -40,7 +40,7 @@ SERVER COMMANDS (server: prefix or no prefix):
   allocator:profile:dump [path] - Write jemalloc heap profile to default or explicit path
   jobs                     - List async debug jobs
   job_status:<id>          - Get async job status/output
-  job_wait:<id>            - Wait for async job to finish
+  job_wait:<id>[:<secs>]   - Wait for async job to finish (default 900s)
   job_cancel:<id>          - Cancel a running job
   jobs:purge               - Remove completed/failed jobs
   jobs:session:<id>        - List jobs for a session
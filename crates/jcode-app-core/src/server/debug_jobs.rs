@@ -227,11 +227,10 @@ pub(super) async fn maybe_handle_job_command(
     }
 
     if cmd.starts_with("job_wait:") {
-        let job_id = cmd.strip_prefix("job_wait:").unwrap_or("").trim();
+        let (job_id, timeout) = parse_job_wait_args(cmd.strip_prefix("job_wait:").unwrap_or(""));
         if job_id.is_empty() {
             return Err(anyhow::anyhow!("job_wait: requires a job id"));
         }
-        let timeout = Duration::from_secs(900);
         let start = Instant::now();
         loop {
             {
@@ -260,6 +259,17 @@ pub(super) async fn maybe_handle_job_command(
     Ok(None)
 }
 
+/// Parse `<id>[:<secs>]`; the wait defaults to 900 seconds.
+pub(super) fn parse_job_wait_args(args: &str) -> (&str, Duration) {
+    let args = args.trim();
+    if let Some((job_id, secs)) = args.rsplit_once(':')
+        && let Ok(secs) = secs.trim().parse::<u64>()
+    {
+        return (job_id.trim(), Duration::from_secs(secs));
+    }
+    (args, Duration::from_secs(900))
+}
+
 async fn create_job(
     agent: &Arc<Mutex<Agent>>,
     debug_jobs: &Arc<RwLock<HashMap<String, DebugJob>>>,
@@ -1,6 +1,7 @@
 mod tests {
     use super::super::*;
-    use crate::server::debug_jobs::DebugJobStatus;
+    use crate::server::debug_jobs::{DebugJobStatus, parse_job_wait_args};
+    use std::time::Duration;
 
     #[test]
     fn client_debug_state_registers_unregisters_and_falls_back() {
@@ -53,6 +54,19 @@ mod tests {
         assert!(status.get("error").is_some());
     }
 
+    #[test]
+    fn parse_job_wait_args_accepts_optional_timeout() {
+        assert_eq!(
+            parse_job_wait_args("job_1_2:30"),
+            ("job_1_2", Duration::from_secs(30))
+        );
+        assert_eq!(
+            parse_job_wait_args(" job_1_2 "),
+            ("job_1_2", Duration::from_secs(900))
+        );
+        assert_eq!(parse_job_wait_args(""), ("", Duration::from_secs(900)));
+    }
+
     #[test]
     fn debug_help_text_mentions_key_namespaces_and_commands() {
         let help = debug_help_text();
@@ -961,3 +961,99 @@ async fn startup_ready_signal_is_not_blocked_by_headless_recovery_delay() -> Res
 
     Ok(())
 }
+
+#[cfg(unix)]
+#[tokio::test]
+#[allow(
+    clippy::await_holding_lock,
+    reason = "test intentionally serializes process-wide JCODE_HOME/env state across async startup assertions"
+)]
+async fn debug_job_wait_timeout_is_answered_without_closing_the_connection() -> Result<()> {
+    use super::debug_jobs::{DebugJob, DebugJobStatus};
+    use crate::protocol::Request;
+    use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
+
+    let _storage_guard = crate::storage::lock_test_env();
+    let temp = tempfile::TempDir::new()?;
+    let _env = configure_test_env(&temp);
+    let _debug_guard = ScopedEnvVar::set("JCODE_DEBUG_CONTROL", "1");
+
+    let server = Server::new(Arc::new(StreamingMockProvider::default()));
+    let now = Instant::now();
+    server.debug_jobs.write().await.insert(
+        "job_running".to_string(),
+        DebugJob {
+            id: "job_running".to_string(),
+            status: DebugJobStatus::Running,
+            command: "message:hello".to_string(),
+            session_id: None,
+            created_at: now,
+            started_at: Some(now),
+            finished_at: None,
+            output: None,
+            error: None,
+        },
+    );
+
+    let debug_socket_path = server.debug_socket_path.clone();
+    let main_listener = crate::transport::Listener::bind(&server.socket_path)?;
+    let debug_listener = crate::transport::Listener::bind(&debug_socket_path)?;
+    let (runtime, main_handle, debug_handle) = timeout(
+        Duration::from_secs(2),
+        server.finish_startup_after_bind(main_listener, debug_listener, Instant::now()),
+    )
+    .await
+    .expect("startup should finish");
+
+    let stream = crate::transport::Stream::connect(&debug_socket_path).await?;
+    let (reader, mut writer) = stream.into_split();
+    let mut reader = BufReader::new(reader);
+    for (id, command) in [(7, "job_wait:job_running:0"), (8, "jobs")] {
+        let request = Request::DebugCommand {
+            id,
+            command: command.to_string(),
+            session_id: None,
+        };
+        writer
+            .write_all((serde_json::to_string(&request)? + "\n").as_bytes())
+            .await?;
+        let mut line = String::new();
+        timeout(Duration::from_secs(2), reader.read_line(&mut line))
+            .await
+            .expect("debug response should arrive")?;
+        assert!(
+            !line.is_empty(),
+            "server closed the debug connection on '{command}'"
+        );
+        let ServerEvent::DebugResponse {
+            id: resp_id,
+            ok,
+            output,
+        } = serde_json::from_str::<ServerEvent>(line.trim())?
+        else {
+            panic!("expected a debug response, got: {line}");
+        };
+        assert_eq!(resp_id, id);
+        if id == 7 {
+            assert!(!ok, "a timed-out wait must report ok=false");
+            assert!(
+                output.starts_with("Timeout waiting for job 'job_running'"),
+                "unexpected output: {output}"
+            );
+        } else {
+            assert!(ok, "the connection should keep serving commands: {output}");
+        }
+    }
+
+    timeout(Duration::from_secs(1), runtime.shutdown())
+        .await
+        .expect("runtime should shut down");
+    timeout(Duration::from_secs(1), async {
+        main_handle.await.expect("main accept loop");
+        debug_handle.await.expect("debug accept loop");
+    })
+    .await
+    .expect("accept loops should observe runtime cancellation");
+
+    Ok(())
+}
@@ -10,7 +10,7 @@ use jcode_base::auth::{claude as claude_auth, oauth};
 use jcode_message_types::{ContentBlock, Message, Role, StreamEvent, ToolDefinition};
 use jcode_provider_core::NativeToolResultSender;
 use jcode_provider_core::{EventStream, Provider};
-use serde::Deserialize;
+use serde::{Deserialize, Serialize};
 use serde_json::{Value, json};
 use std::collections::HashSet;
 use std::path::PathBuf;
@@ -90,11 +90,13 @@ impl ClaudeProvider {
             if msg.role != Role::User {
                 continue;
             }
-            let mut parts = Vec::new();
+            // Borrow the parts and size the prompt up front, so each part is
+            // copied exactly once.
+            let mut parts: Vec<&str> = Vec::new();
             for block in &msg.content {
                 match block {
-                    ContentBlock::Text { text, .. } => parts.push(text.clone()),
-                    ContentBlock::ToolResult { content, .. } => parts.push(content.clone()),
+                    ContentBlock::Text { text, .. } => parts.push(text),
+                    ContentBlock::ToolResult { content, .. } => parts.push(content),
                     ContentBlock::ToolUse { .. } => {}
                     ContentBlock::Reasoning { .. }
                     | ContentBlock::ReasoningTrace { .. }
@@ -173,6 +175,18 @@ impl ClaudeCliConfig {
     }
 }
 
+#[derive(Serialize)]
+#[serde(tag = "type", rename_all = "snake_case")]
+enum CliInput<'a> {
+    User { message: CliInputMessage<'a> },
+}
+
+#[derive(Serialize)]
+struct CliInputMessage<'a> {
+    role: &'static str,
+    content: &'a str,
+}
+
 #[derive(Deserialize)]
 #[serde(tag = "type", rename_all = "snake_case")]
 enum CliOutput {
@@ -487,7 +501,7 @@ impl CliOutputParser {
                 events
             }
             CliOutput::Assistant { message, .. } => {
-                let blocks = parse_content_blocks(&message.content);
+                let blocks = parse_content_blocks(message.content);
                 let mut events = Vec::new();
                 for block in blocks {
                     match block {
@@ -513,18 +527,9 @@ impl CliOutputParser {
                             content,
                             is_error,
                         } => {
-                            let content_str = content
-                                .map(|v| {
-                                    if let Some(s) = v.as_str() {
-                                        s.to_string()
-                                    } else {
-                                        serde_json::to_string(&v).unwrap_or_default()
-                                    }
-                                })
-                                .unwrap_or_default();
                             events.push(StreamEvent::ToolResult {
                                 tool_use_id,
-                                content: content_str,
+                                content: tool_result_text(content),
                                 is_error: is_error.unwrap_or(false),
                             });
                         }
@@ -540,7 +545,7 @@ impl CliOutputParser {
                 events
             }
             CliOutput::User { message, .. } => {
-                let blocks = parse_content_blocks(&message.content);
+                let blocks = parse_content_blocks(message.content);
                 let mut events = Vec::new();
                 for block in blocks {
                     if let SdkContentBlock::ToolResult {
@@ -549,18 +554,9 @@ impl CliOutputParser {
                         is_error,
                     } = block
                     {
-                        let content_str = content
-                            .map(|v| {
-                                if let Some(s) = v.as_str() {
-                                    s.to_string()
-                                } else {
-                                    serde_json::to_string(&v).unwrap_or_default()
-                                }
-                            })
-                            .unwrap_or_default();
                         events.push(StreamEvent::ToolResult {
                             tool_use_id,
-                            content: content_str,
+                            content: tool_result_text(content),
                             is_error: is_error.unwrap_or(false),
                         });
                     }
@@ -616,12 +612,24 @@ impl CliOutputParser {
     }
 }
 
-fn parse_content_blocks(content: &Value) -> Vec<SdkContentBlock> {
+/// Flatten tool result content to text: strings are moved out as-is, any
+/// other JSON is re-serialized.
+fn tool_result_text(content: Option<Value>) -> String {
+    match content {
+        Some(Value::String(text)) => text,
+        Some(other) => serde_json::to_string(&other).unwrap_or_default(),
+        None => String::new(),
+    }
+}
+
+/// Takes the content by value so each block is moved into its typed variant
+/// rather than cloned first.
+fn parse_content_blocks(content: Value) -> Vec<SdkContentBlock> {
     match content {
-        Value::String(text) => vec![SdkContentBlock::Text { text: text.clone() }],
+        Value::String(text) => vec![SdkContentBlock::Text { text }],
         Value::Array(items) => items
-            .iter()
-            .filter_map(|item| serde_json::from_value(item.clone()).ok())
+            .into_iter()
+            .filter_map(|item| serde_json::from_value(item).ok())
             .collect(),
         _ => Vec::new(),
     }
@@ -935,6 +943,22 @@ async fn run_claude_cli(
         .stdout(Stdio::piped())
         .stderr(Stdio::piped());
 
+    // Serialize the borrowed prompt straight to bytes and append the framing
+    // newline, so the request reaches the CLI in a single write. JSON escaping
+    // can only lengthen the prompt, so its length is a lower bound for the
+    // buffer; the envelope and any escapes may still grow it once.
+    let mut payload = Vec::with_capacity(prompt.len() + 64);
+    serde_json::to_writer(
+        &mut payload,
+        &CliInput::User {
+            message: CliInputMessage {
+                role: "user",
+                content: &prompt,
+            },
+        },
+    )?;
+    payload.push(b'\n');
+
     let mut child = cmd
         .spawn()
         .with_context(|| format!("Failed to spawn Claude CLI using {}", config.cli_path))?;
@@ -944,22 +968,13 @@ async fn run_claude_cli(
         .take()
         .ok_or_else(|| anyhow::anyhow!("Failed to capture Claude CLI stdin"))?;
 
-    let payload = serde_json::json!({
-        "type": "user",
-        "message": {
-            "role": "user",
-            "content": prompt,
-        }
-    });
-
     async fn terminate_child(child: &mut tokio::process::Child) {
         let _ = child.kill().await;
         let _ = tokio::time::timeout(Duration::from_secs(2), child.wait()).await;
     }
 
     if let Err(err) = async {
-        stdin.write_all(payload.to_string().as_bytes()).await?;
-        stdin.write_all(b"\n").await?;
+        stdin.write_all(&payload).await?;
         stdin.flush().await?;
         Ok::<(), std::io::Error>(())
     }
@@ -988,7 +1003,11 @@ async fn run_claude_cli(
         drop(tx_stderr);
     });
 
-    let mut reader = BufReader::new(stdout).lines();
+    // Frames are parsed straight from bytes; serde_json validates UTF-8 as it
+    // goes, so there is no separate String decode per line. One buffer is
+    // reused for every line.
+    let mut reader = BufReader::new(stdout);
+    let mut line_buf = Vec::new();
     let mut parser = CliOutputParser::new();
     let mut saw_output = false;
 
@@ -998,16 +1017,20 @@ async fn run_claude_cli(
                 terminate_child(&mut child).await;
                 return Ok(());
             }
-            line = reader.next_line() => {
-                let line = match line? {
-                    Some(line) => line,
-                    None => break,
+            // read_until is cancel safe: a partial line stays in line_buf.
+            read = reader.read_until(b'\n', &mut line_buf) => {
+                if read? == 0 {
+                    break;
+                }
+                let parsed = match line_buf.trim_ascii() {
+                    [] => None,
+                    line => Some(serde_json::from_slice::<CliOutput>(line)),
                 };
-                let line = line.trim();
-                if line.is_empty() {
+                line_buf.clear();
+                let Some(parsed) = parsed else {
                     continue;
-                }
-                match serde_json::from_str::<CliOutput>(line) {
+                };
+                match parsed {
                     Ok(output) => {
                         for event in parser.handle_output(output) {
                             if let StreamEvent::Error { message, .. } = &event {
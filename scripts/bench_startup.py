@@ -13,8 +13,11 @@ isolated log.
 from __future__ import annotations
 
 import argparse
+import ctypes
+import ctypes.util
 import os
 import re
+import select
 import shutil
 import socket
 import statistics
@@ -22,6 +25,7 @@ import subprocess
 import sys
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
@@ -31,6 +35,11 @@ PROFILE_LINE_RE = re.compile(
     r"\[INFO\]\s+([0-9.]+)ms\s+([0-9.]+)ms\s+[0-9.]+%\s+([a-zA-Z0-9_]+)"
 )
 REMOTE_HISTORY_RE = re.compile(r"remote bootstrap: history after ([0-9.]+)ms")
+IN_CREATE = 0x00000100
+QUIET_FILE_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
 
 
 @dataclass
@@ -56,6 +65,14 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="fail if startup budgets are exceeded",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help=(
+            "run --help/--version samples one at a time instead of in a process "
+            "pool (always the case under --check)"
+        ),
+    )
     parser.add_argument("--max-help-ms", type=float, default=20.0)
     parser.add_argument("--max-version-ms", type=float, default=20.0)
     parser.add_argument("--max-server-ready-ms", type=float, default=80.0)
@@ -94,13 +111,30 @@ def print_stats(name: str, times: list[float]) -> None:
         print(f"  Stdev:  {statistics.stdev(times):.2f} ms")
 
 
-def run_simple_timing(binary: str, *args: str, runs: int) -> list[float]:
-    times: list[float] = []
-    for _ in range(runs):
-        start = time.perf_counter()
-        subprocess.run([binary, *args], capture_output=True, check=False)
-        times.append((time.perf_counter() - start) * 1000)
-    return times
+def spawn_timed_ns(argv: list[str]) -> int:
+    # posix_spawn skips the subprocess module's pipe setup and fd scrubbing,
+    # which is a measurable fraction of a ~1 ms --help/--version run.
+    start = time.perf_counter_ns()
+    pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=QUIET_FILE_ACTIONS)
+    os.waitpid(pid, 0)
+    return time.perf_counter_ns() - start
+
+
+def run_simple_timing(binary: str, *args: str, runs: int, parallel: bool = False) -> list[float]:
+    """Time ``runs`` invocations of ``binary args``.
+
+    Samples are independent, so ``parallel`` spreads them across a process pool
+    to cut wall time. Concurrent spawns contend for CPU and page cache, so use
+    the sequential path when individual samples need to be low-noise.
+    """
+    argv = [binary, *args]
+    if parallel and runs > 1:
+        workers = min(runs, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            elapsed_ns = list(executor.map(spawn_timed_ns, [argv] * runs))
+    else:
+        elapsed_ns = [spawn_timed_ns(argv) for _ in range(runs)]
+    return [ns / 1_000_000 for ns in elapsed_ns]
 
 
 def isolated_env(root: str) -> dict[str, str]:
@@ -114,19 +148,62 @@ def isolated_env(root: str) -> dict[str, str]:
     return env
 
 
-def wait_for_socket(path: str, timeout_s: float) -> bool:
-    deadline = time.perf_counter() + timeout_s
-    while time.perf_counter() < deadline:
-        if os.path.exists(path):
-            try:
-                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                sock.connect(path)
-                sock.close()
-                return True
-            except OSError:
-                pass
-        time.sleep(0.005)
-    return False
+def open_create_watch(directory: str) -> int | None:
+    """Return a non-blocking inotify fd watching ``directory`` for new entries.
+
+    Returns None where inotify is unavailable (non-Linux), in which case
+    callers fall back to polling.
+    """
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (AttributeError, OSError):
+        return None
+    inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    if inotify_add_watch(fd, os.fsencode(directory), IN_CREATE) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def wait_for_socket(path: str, timeout_s: float, watch_fd: int | None = None) -> bool:
+    """Wait until ``path`` accepts a connection.
+
+    With an inotify ``watch_fd`` on the parent directory the wait wakes as soon
+    as the socket is created; connect() is then retried with an exponential
+    backoff starting at 100 us to cover the bind-to-listen gap.
+    """
+    perf_counter = time.perf_counter
+    exists = os.path.exists
+    sleep = time.sleep
+    deadline = perf_counter() + timeout_s
+    delay = 0.0001
+    while True:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+            return True
+        except OSError:
+            pass
+        finally:
+            sock.close()
+        remaining = deadline - perf_counter()
+        if remaining <= 0:
+            return False
+        if watch_fd is not None and not exists(path):
+            ready, _, _ = select.select([watch_fd], [], [], remaining)
+            if ready:
+                try:
+                    os.read(watch_fd, 4096)
+                except BlockingIOError:
+                    pass
+            continue
+        sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.005)
 
 
 def measure_server_startup(binary: str, runs: int) -> list[float]:
@@ -135,6 +212,7 @@ def measure_server_startup(binary: str, runs: int) -> list[float]:
         root = tempfile.mkdtemp(prefix="jcode-server-bench-")
         env = isolated_env(root)
         socket_path = env["JCODE_SOCKET"]
+        watch_fd = open_create_watch(os.path.dirname(socket_path))
         proc = None
         try:
             start = time.perf_counter()
@@ -144,16 +222,17 @@ def measure_server_startup(binary: str, runs: int) -> list[float]:
                 stderr=subprocess.DEVNULL,
                 env=env,
             )
-            if wait_for_socket(socket_path, 5.0):
+            if wait_for_socket(socket_path, 5.0, watch_fd):
                 times.append((time.perf_counter() - start) * 1000)
         finally:
+            if watch_fd is not None:
+                os.close(watch_fd)
             if proc is not None:
-                proc.terminate()
-                try:
-                    proc.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
-                    proc.wait(timeout=2)
+                # Cleanup is outside the measured window, so skip graceful shutdown.
+                # SIGKILL cannot be ignored, so an unbounded wait always returns
+                # and never masks the error that got us here.
+                proc.kill()
+                proc.wait()
             shutil.rmtree(root, ignore_errors=True)
     return times
 
@@ -303,10 +382,15 @@ def main() -> int:
 
     subprocess.run([binary, "--version"], capture_output=True, check=False)
 
-    help_times = run_simple_timing(binary, "--help", runs=args.runs)
+    # Concurrent samples contend for CPU and inflate each other's timings, so
+    # budget checks always measure one process at a time.
+    parallel = not (args.sequential or args.check)
+    help_times = run_simple_timing(binary, "--help", runs=args.runs, parallel=parallel)
     print_stats("--help (binary load)", help_times)
 
-    version_times = run_simple_timing(binary, "--version", runs=args.runs)
+    version_times = run_simple_timing(
+        binary, "--version", runs=args.runs, parallel=parallel
+    )
     print_stats("--version", version_times)
 
     print(f"\nMeasuring isolated server startup ({args.runs} runs)...")
@@ -10,7 +10,8 @@ Usage:
     python scripts/benchmark_swarm.py --single-only    # Single agent only
     python scripts/benchmark_swarm.py --swarm-only     # Swarm only
     python scripts/benchmark_swarm.py --timeout 30     # 30 minute timeout per trial
-    python scripts/benchmark_swarm.py --check-interval 15  # Check cycles every 15s
+    python scripts/benchmark_swarm.py --check-interval 15  # Poll at most 15s apart
+    python scripts/benchmark_swarm.py --sequential     # Run trials one at a time
 
 Environment:
     Requires jcode server running with debug_control enabled:
@@ -21,12 +22,15 @@ Environment:
 import argparse
 import json
 import os
-import select
+import re
 import shutil
 import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
 DEBUG_SOCKET = f"/run/user/{os.getuid()}/jcode-debug.sock"
@@ -36,49 +40,130 @@ TAKEHOME_SOURCE = os.environ.get(
 )
 BENCHMARK_DIR = "/tmp/takehome-benchmark"
 BASELINE = 147734
+MIN_POLL_INTERVAL = 2.0
+
+# Published reference cycle counts, from loosest to tightest.
+THRESHOLDS: tuple[tuple[str, int], ...] = (
+    ("Baseline", BASELINE),
+    ("Updated starter", 18532),
+    ("Opus 4 many hours", 2164),
+    ("Opus 4.5 casual (best human 2hr)", 1790),
+    ("Opus 4.5 2hr harness", 1579),
+    ("Sonnet 4.5 many hours", 1548),
+    ("Opus 4.5 11.5hr harness", 1487),
+    ("Opus 4.5 improved harness", 1363),
+)
+CYCLES_RE = re.compile(rb"CYCLES:\s*(\d+)")
+
+
+_print_lock = threading.Lock()
+
+
+def log(*args, **kwargs):
+    """print() that keeps lines from concurrently running trials intact."""
+    with _print_lock:
+        print(*args, **kwargs)
 
 
 # ---------------------------------------------------------------------------
 # Socket helpers
 # ---------------------------------------------------------------------------
 
-def send_cmd(cmd: str, session_id: str = None, timeout: float = 300) -> tuple:
-    """Send a debug command and return (ok, output, error)."""
-    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    sock.connect(DEBUG_SOCKET)
-    sock.setblocking(False)
+class DebugConnection:
+    """A persistent debug-socket connection.
+
+    Callers hold ``lock`` across ``send`` and ``readline`` so that requests on
+    one connection are serialized.
+    """
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(DEBUG_SOCKET)
+        self.rfile = self.sock.makefile("rb", buffering=65536)
+        self.lock = threading.Lock()
+
+    def send(self, payload: bytes, timeout: float):
+        self.sock.settimeout(timeout)
+        self.sock.sendall(payload)
+
+    def readline(self) -> bytes:
+        # Responses are newline-framed; readline returns as soon as the frame
+        # arrives, however large it is.
+        return self.rfile.readline()
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+
+# session_id (None for server-level commands) -> open connection
+_conn_pool: dict = {}
+_conn_pool_lock = threading.Lock()
+
+
+def _pooled_connection(session_id: str) -> DebugConnection:
+    with _conn_pool_lock:
+        conn = _conn_pool.get(session_id)
+        if conn is None:
+            conn = _conn_pool[session_id] = DebugConnection()
+        return conn
+
+
+def _evict_connection(session_id: str, conn: DebugConnection):
+    with _conn_pool_lock:
+        if _conn_pool.get(session_id) is conn:
+            del _conn_pool[session_id]
+    conn.close()
 
+
+def send_cmd(cmd: str, session_id: str = None, timeout: float = 300) -> tuple:
+    """Send a debug command and return (ok, output, error).
+
+    Reuses one connection per session. If sending on a pooled connection fails,
+    the server closed it while idle and never saw the command, so it is resent
+    once on a fresh connection. Once the command has been written it is never
+    resent, since commands like message_async or create_session are not
+    idempotent; any failure after that drops the connection (a late response
+    would otherwise be read as the next reply) and is reported to the caller.
+    """
     req = {"type": "debug_command", "id": 1, "command": cmd}
     if session_id:
         req["session_id"] = session_id
+    payload = (json.dumps(req) + "\n").encode()
 
-    sock.send((json.dumps(req) + "\n").encode())
-
-    start = time.time()
-    data = b""
-    while time.time() - start < timeout:
-        ready, _, _ = select.select([sock], [], [], 1.0)
-        if ready:
+    for attempt in range(2):
+        conn = _pooled_connection(session_id)
+        with conn.lock:
             try:
-                chunk = sock.recv(65536)
-                if not chunk:
-                    break
-                data += chunk
-                if b"\n" in data:
-                    break
-            except BlockingIOError:
+                conn.send(payload, timeout)
+            except socket.timeout:
+                _evict_connection(session_id, conn)
+                return False, "", "Timeout"
+            except OSError:
+                _evict_connection(session_id, conn)
+                if attempt:
+                    raise
                 continue
 
-    sock.close()
-
-    if not data:
-        return False, "", "Timeout"
-
-    try:
-        resp = json.loads(data.decode().strip())
+            try:
+                line = conn.readline()
+            except socket.timeout:
+                _evict_connection(session_id, conn)
+                return False, "", "Timeout"
+            except OSError as e:
+                _evict_connection(session_id, conn)
+                return False, "", f"Connection error: {e}"
+
+        if not line:
+            _evict_connection(session_id, conn)
+            return False, "", "Connection closed"
+
+        try:
+            resp = json.loads(line)
+        except json.JSONDecodeError as e:
+            _evict_connection(session_id, conn)
+            return False, "", f"JSON error: {e}"
         return resp.get("ok", False), resp.get("output", ""), resp.get("error", "")
-    except json.JSONDecodeError as e:
-        return False, "", f"JSON error: {e}"
 
 
 def create_session(working_dir: str) -> tuple:
@@ -91,64 +176,159 @@ def create_session(working_dir: str) -> tuple:
 
 
 def destroy_session(session_id: str):
-    """Destroy a session."""
+    """Destroy a session and close its pooled connection."""
     send_cmd(f"destroy_session:{session_id}")
+    with _conn_pool_lock:
+        conn = _conn_pool.pop(session_id, None)
+    if conn is not None:
+        conn.close()
 
 
 # ---------------------------------------------------------------------------
 # Workspace helpers
 # ---------------------------------------------------------------------------
 
-def setup_workspace(name: str) -> str:
+def copy_tree(src: str, dst: str):
+    """Copy src to dst, sharing file extents via reflink where the filesystem allows.
+
+    On btrfs/xfs the copy is a metadata-only operation; elsewhere GNU cp falls
+    back to a regular copy. Mtimes and permissions are preserved, matching
+    benchmark_takehome.py. Hardlinks are deliberately not used: agents may
+    rewrite files in place, which would corrupt the shared source tree.
+    """
+    result = subprocess.run(
+        ["cp", "-a", "--reflink=auto", src, dst], capture_output=True
+    )
+    if result.returncode != 0:
+        # Non-GNU cp (e.g. macOS) has no --reflink; start from a clean slate.
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkspacePaths:
+    """Paths inside a benchmark workspace, resolved once at setup."""
+    name: str
+    root: str
+    tests_py: str
+
+
+def setup_workspace(name: str) -> WorkspacePaths:
     """Create a clean copy of the take-home challenge."""
     workspace = os.path.join(BENCHMARK_DIR, name)
-    if os.path.exists(workspace):
-        shutil.rmtree(workspace)
-    shutil.copytree(TAKEHOME_SOURCE, workspace)
-    # Initialize a git repo so swarm_id detection works
-    subprocess.run(["git", "init"], cwd=workspace, capture_output=True)
-    subprocess.run(["git", "add", "."], cwd=workspace, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "initial"],
-        cwd=workspace,
-        capture_output=True,
-        env={**os.environ, "GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "b@b",
-             "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "b@b"},
+    shutil.rmtree(workspace, ignore_errors=True)
+    copy_tree(TAKEHOME_SOURCE, workspace)
+    # Initialize a git repo so swarm_id detection works (it keys on the .git
+    # dir), and commit the pristine tree so agents can diff their changes.
+    git = ["git", "-C", workspace, "-c", "user.name=bench", "-c", "user.email=b@b"]
+    subprocess.run([*git, "init", "-q"], capture_output=True)
+    subprocess.run([*git, "add", "-A"], capture_output=True)
+    subprocess.run([*git, "commit", "-q", "--no-verify", "-m", "initial"], capture_output=True)
+    return WorkspacePaths(
+        name=name,
+        root=workspace,
+        tests_py=os.path.join(workspace, "tests", "submission_tests.py"),
     )
-    return workspace
 
 
-def get_cycles(workspace: str) -> int:
-    """Run submission_tests.py and extract cycle count."""
+# workspace root -> (source signature, cycles) from the last successful test run
+_cycles_cache: dict[str, tuple[tuple, int]] = {}
+
+
+def _source_signature(workspace: str) -> tuple:
+    """Cheap fingerprint of every Python source in the workspace (path, mtime, size).
+
+    Files or directories that vanish mid-walk (e.g. an editor's atomic rename)
+    are skipped; the next poll sees the settled tree.
+    """
+    entries = []
+    stack = [workspace]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((entry.path, st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
+def get_cycles(workspace: WorkspacePaths) -> int:
+    """Run submission_tests.py and extract cycle count.
+
+    The result is reused while no Python source in the workspace has changed,
+    so idle poll ticks skip the test subprocess entirely.
+    """
     try:
+        signature = _source_signature(workspace.root)
+        cached = _cycles_cache.get(workspace.root)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         result = subprocess.run(
-            [sys.executable, "tests/submission_tests.py", "-v"],
-            cwd=workspace,
+            [sys.executable, workspace.tests_py, "-v"],
+            cwd=workspace.root,
             capture_output=True,
-            text=True,
             timeout=120,
         )
-        for line in (result.stdout + result.stderr).split("\n"):
-            if "CYCLES:" in line:
-                return int(line.split("CYCLES:")[1].strip())
+        match = CYCLES_RE.search(result.stdout) or CYCLES_RE.search(result.stderr)
+        if match:
+            cycles = int(match.group(1))
+            _cycles_cache[workspace.root] = (signature, cycles)
+            return cycles
     except Exception as e:
-        print(f"  Error getting cycles: {e}")
+        log(f"  Error getting cycles: {e}")
     return BASELINE
 
 
-def get_test_summary(workspace: str) -> str:
-    """Run submission tests and return the full output summary."""
+def get_test_summary(workspace: WorkspacePaths) -> None:
+    """Run submission tests, logging their output as it arrives.
+
+    Each line is logged immediately (prefixed with the workspace name so
+    concurrent trials stay distinguishable); nothing is buffered, so memory
+    stays flat however verbose the run is.
+    """
+    timed_out = threading.Event()
+    proc = None
+
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(120, kill_on_timeout)
     try:
-        result = subprocess.run(
-            [sys.executable, "tests/submission_tests.py", "-v"],
-            cwd=workspace,
-            capture_output=True,
+        proc = subprocess.Popen(
+            [sys.executable, workspace.tests_py, "-v"],
+            cwd=workspace.root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=120,
+            errors="replace",
+            bufsize=1,
         )
-        return result.stdout + result.stderr
+        watchdog.start()
+        with proc.stdout:
+            for line in proc.stdout:
+                log(f"  [{workspace.name}] {line.rstrip()}")
+        proc.wait()
     except Exception as e:
-        return f"Error: {e}"
+        log(f"  [{workspace.name}] Error running tests: {e}")
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+    finally:
+        watchdog.cancel()
+    if timed_out.is_set():
+        log(f"  [{workspace.name}] Tests killed after 120s timeout")
 
 
 # ---------------------------------------------------------------------------
@@ -188,10 +368,31 @@ Work efficiently - focus on the highest-impact optimizations first."""
 # Poll loop for async jobs
 # ---------------------------------------------------------------------------
 
+class PollBackoff:
+    """Adaptive poll interval.
+
+    Polls every MIN_POLL_INTERVAL seconds while the observed state keeps
+    changing, and backs off by 1.5x per unchanged tick up to ``cap``.
+    """
+
+    def __init__(self, cap: float):
+        self.cap = cap
+        self.interval = min(MIN_POLL_INTERVAL, cap)
+        self.last_state = None
+
+    def next_interval(self, state) -> float:
+        if state != self.last_state:
+            self.interval = min(MIN_POLL_INTERVAL, self.cap)
+        else:
+            self.interval = min(self.cap, self.interval * 1.5)
+        self.last_state = state
+        return self.interval
+
+
 def poll_job(
     job_id: str,
     session_id: str,
-    workspace: str,
+    workspace: WorkspacePaths,
     start_time: float,
     timeout_seconds: float,
     check_interval: float,
@@ -200,22 +401,29 @@ def poll_job(
     """Poll a job until completion, printing cycle updates. Returns best cycle count."""
     best_cycles = BASELINE
     last_cycles = BASELINE
+    backoff = PollBackoff(check_interval)
+    last_status_raw = None
+    status = {}
 
     while time.time() - start_time < timeout_seconds:
         elapsed = time.time() - start_time
+        job_status = None
 
         # Check job status
         ok, status_output, _ = send_cmd(f"job_status:{job_id}", session_id, timeout=10)
         if ok:
             try:
-                status = json.loads(status_output)
+                # Status rarely changes between ticks; only re-parse when it does.
+                if status_output != last_status_raw:
+                    status = json.loads(status_output)
+                    last_status_raw = status_output
                 job_status = status.get("status", "unknown")
                 if job_status == "completed":
-                    print(f"\n  [{label}] [{elapsed/60:.1f}m] Job completed")
+                    log(f"\n  [{label}] [{elapsed/60:.1f}m] Job completed")
                     break
                 elif job_status == "failed":
                     error = status.get("error", "unknown")
-                    print(f"\n  [{label}] [{elapsed/60:.1f}m] Job failed: {error}")
+                    log(f"\n  [{label}] [{elapsed/60:.1f}m] Job failed: {error}")
                     break
             except (json.JSONDecodeError, ValueError):
                 pass
@@ -225,12 +433,12 @@ def poll_job(
         if cycles < best_cycles:
             best_cycles = cycles
             speedup = BASELINE / cycles
-            print(f"  [{label}] [{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({speedup:.2f}x speedup)")
+            log(f"  [{label}] [{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({speedup:.2f}x speedup)")
         elif cycles != last_cycles:
-            print(f"  [{label}] [{elapsed/60:.1f}m] Cycles: {cycles}")
+            log(f"  [{label}] [{elapsed/60:.1f}m] Cycles: {cycles}")
         last_cycles = cycles
 
-        time.sleep(check_interval)
+        time.sleep(backoff.next_interval((job_status, cycles)))
 
     # Final check
     cycles = get_cycles(workspace)
@@ -246,31 +454,31 @@ def poll_job(
 
 def run_single_agent(timeout_minutes: float, check_interval: float) -> dict:
     """Run a single agent on the optimization task."""
-    print("\n" + "=" * 70)
-    print(f"  TRIAL A: SINGLE AGENT (timeout: {timeout_minutes}m)")
-    print("=" * 70)
+    log("\n" + "=" * 70)
+    log(f"  TRIAL A: SINGLE AGENT (timeout: {timeout_minutes}m)")
+    log("=" * 70)
 
     workspace = setup_workspace("single")
-    print(f"  Workspace: {workspace}")
+    log(f"  Workspace: {workspace.root}")
 
     start_time = time.time()
     session_id = None
 
     try:
-        session_id, name = create_session(workspace)
-        print(f"  Session: {name} ({session_id[:12]}...)")
+        session_id, name = create_session(workspace.root)
+        log(f"  Session: {name} ({session_id[:12]}...)")
 
         baseline_cycles = get_cycles(workspace)
-        print(f"  Baseline: {baseline_cycles} cycles")
+        log(f"  Baseline: {baseline_cycles} cycles")
 
         # Build prompt
-        prompt = OPTIMIZATION_PROMPT_TEMPLATE.format(workspace=workspace)
+        prompt = OPTIMIZATION_PROMPT_TEMPLATE.format(workspace=workspace.root)
 
         # Start async job
-        print("\n  Starting optimization (message_async)...")
+        log("\n  Starting optimization (message_async)...")
         ok, output, err = send_cmd(f"message_async:{prompt}", session_id, timeout=30)
         if not ok:
-            print(f"  Failed to start async job: {err}")
+            log(f"  Failed to start async job: {err}")
             return {
                 "approach": "single",
                 "cycles": BASELINE,
@@ -280,7 +488,7 @@ def run_single_agent(timeout_minutes: float, check_interval: float) -> dict:
 
         job_data = json.loads(output)
         job_id = job_data.get("job_id")
-        print(f"  Job started: {job_id}")
+        log(f"  Job started: {job_id}")
 
         # Poll until done
         timeout_seconds = timeout_minutes * 60
@@ -291,22 +499,22 @@ def run_single_agent(timeout_minutes: float, check_interval: float) -> dict:
 
         elapsed = time.time() - start_time
         speedup = BASELINE / best_cycles if best_cycles > 0 else 0
-        print(f"\n  SINGLE AGENT RESULT: {best_cycles} cycles in {elapsed/60:.1f}m ({speedup:.2f}x)")
+        log(f"\n  SINGLE AGENT RESULT: {best_cycles} cycles in {elapsed/60:.1f}m ({speedup:.2f}x)")
 
-        # Get full test output
-        test_output = get_test_summary(workspace)
-        print(f"\n  Test output:\n{test_output}")
+        # Stream full test output
+        log("\n  Test output:")
+        get_test_summary(workspace)
 
         return {
             "approach": "single",
             "cycles": best_cycles,
             "time_seconds": elapsed,
-            "workspace": workspace,
+            "workspace": workspace.root,
         }
 
     except Exception as e:
         elapsed = time.time() - start_time
-        print(f"  Error: {e}")
+        log(f"  Error: {e}")
         return {
             "approach": "single",
             "cycles": BASELINE,
@@ -315,7 +523,7 @@ def run_single_agent(timeout_minutes: float, check_interval: float) -> dict:
         }
     finally:
         if session_id:
-            print(f"  Cleaning up session {session_id[:12]}...")
+            log(f"  Cleaning up session {session_id[:12]}...")
             destroy_session(session_id)
 
 
@@ -325,31 +533,31 @@ def run_single_agent(timeout_minutes: float, check_interval: float) -> dict:
 
 def run_swarm(timeout_minutes: float, check_interval: float) -> dict:
     """Run swarm multi-agent on the optimization task."""
-    print("\n" + "=" * 70)
-    print(f"  TRIAL B: SWARM / MULTI-AGENT (timeout: {timeout_minutes}m)")
-    print("=" * 70)
+    log("\n" + "=" * 70)
+    log(f"  TRIAL B: SWARM / MULTI-AGENT (timeout: {timeout_minutes}m)")
+    log("=" * 70)
 
     workspace = setup_workspace("swarm")
-    print(f"  Workspace: {workspace}")
+    log(f"  Workspace: {workspace.root}")
 
     start_time = time.time()
     session_id = None
 
     try:
-        session_id, name = create_session(workspace)
-        print(f"  Coordinator: {name} ({session_id[:12]}...)")
+        session_id, name = create_session(workspace.root)
+        log(f"  Coordinator: {name} ({session_id[:12]}...)")
 
         baseline_cycles = get_cycles(workspace)
-        print(f"  Baseline: {baseline_cycles} cycles")
+        log(f"  Baseline: {baseline_cycles} cycles")
 
         # Build prompt (same optimization goal)
-        prompt = OPTIMIZATION_PROMPT_TEMPLATE.format(workspace=workspace)
+        prompt = OPTIMIZATION_PROMPT_TEMPLATE.format(workspace=workspace.root)
 
         # Start swarm async job - this automatically plans subtasks and spawns agents
-        print("\n  Starting swarm (swarm_message_async)...")
+        log("\n  Starting swarm (swarm_message_async)...")
         ok, output, err = send_cmd(f"swarm_message_async:{prompt}", session_id, timeout=30)
         if not ok:
-            print(f"  Failed to start swarm: {err}")
+            log(f"  Failed to start swarm: {err}")
             return {
                 "approach": "swarm",
                 "cycles": BASELINE,
@@ -359,28 +567,34 @@ def run_swarm(timeout_minutes: float, check_interval: float) -> dict:
 
         job_data = json.loads(output)
         job_id = job_data.get("job_id")
-        print(f"  Swarm job started: {job_id}")
+        log(f"  Swarm job started: {job_id}")
 
         timeout_seconds = timeout_minutes * 60
         best_cycles = BASELINE
         last_cycles = BASELINE
         member_info_printed = False
+        backoff = PollBackoff(check_interval)
+        last_status_raw = None
+        status = {}
 
         while time.time() - start_time < timeout_seconds:
             elapsed = time.time() - start_time
+            job_status = None
 
             # Check job status
             ok, status_output, _ = send_cmd(f"job_status:{job_id}", session_id, timeout=10)
             if ok:
                 try:
-                    status = json.loads(status_output)
+                    if status_output != last_status_raw:
+                        status = json.loads(status_output)
+                        last_status_raw = status_output
                     job_status = status.get("status", "unknown")
                     if job_status == "completed":
-                        print(f"\n  [swarm] [{elapsed/60:.1f}m] Swarm completed!")
+                        log(f"\n  [swarm] [{elapsed/60:.1f}m] Swarm completed!")
                         break
                     elif job_status == "failed":
                         error = status.get("error", "unknown")
-                        print(f"\n  [swarm] [{elapsed/60:.1f}m] Swarm failed: {error}")
+                        log(f"\n  [swarm] [{elapsed/60:.1f}m] Swarm failed: {error}")
                         break
                 except (json.JSONDecodeError, ValueError):
                     pass
@@ -391,11 +605,11 @@ def run_swarm(timeout_minutes: float, check_interval: float) -> dict:
                 if ok:
                     try:
                         members = json.loads(swarm_output)
-                        print(f"  [swarm] [{elapsed/60:.1f}m] {len(members)} agent(s) in swarm")
+                        log(f"  [swarm] [{elapsed/60:.1f}m] {len(members)} agent(s) in swarm")
                         for m in members[:5]:
                             sid = m.get("session_id", "?")[:12]
                             st = m.get("status", "?")
-                            print(f"    - {sid}... ({st})")
+                            log(f"    - {sid}... ({st})")
                         member_info_printed = True
                     except (json.JSONDecodeError, ValueError):
                         pass
@@ -405,12 +619,12 @@ def run_swarm(timeout_minutes: float, check_interval: float) -> dict:
             if cycles < best_cycles:
                 best_cycles = cycles
                 speedup = BASELINE / cycles
-                print(f"  [swarm] [{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({speedup:.2f}x speedup)")
+                log(f"  [swarm] [{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({speedup:.2f}x speedup)")
             elif cycles != last_cycles:
-                print(f"  [swarm] [{elapsed/60:.1f}m] Cycles: {cycles}")
+                log(f"  [swarm] [{elapsed/60:.1f}m] Cycles: {cycles}")
             last_cycles = cycles
 
-            time.sleep(check_interval)
+            time.sleep(backoff.next_interval((job_status, cycles)))
 
         # Final check
         cycles = get_cycles(workspace)
@@ -419,22 +633,22 @@ def run_swarm(timeout_minutes: float, check_interval: float) -> dict:
 
         elapsed = time.time() - start_time
         speedup = BASELINE / best_cycles if best_cycles > 0 else 0
-        print(f"\n  SWARM RESULT: {best_cycles} cycles in {elapsed/60:.1f}m ({speedup:.2f}x)")
+        log(f"\n  SWARM RESULT: {best_cycles} cycles in {elapsed/60:.1f}m ({speedup:.2f}x)")
 
-        # Get full test output
-        test_output = get_test_summary(workspace)
-        print(f"\n  Test output:\n{test_output}")
+        # Stream full test output
+        log("\n  Test output:")
+        get_test_summary(workspace)
 
         return {
             "approach": "swarm",
             "cycles": best_cycles,
             "time_seconds": elapsed,
-            "workspace": workspace,
+            "workspace": workspace.root,
         }
 
     except Exception as e:
         elapsed = time.time() - start_time
-        print(f"  Error: {e}")
+        log(f"  Error: {e}")
         return {
             "approach": "swarm",
             "cycles": BASELINE,
@@ -443,7 +657,7 @@ def run_swarm(timeout_minutes: float, check_interval: float) -> dict:
         }
     finally:
         if session_id:
-            print(f"  Cleaning up session {session_id[:12]}...")
+            log(f"  Cleaning up session {session_id[:12]}...")
             destroy_session(session_id)
 
 
@@ -453,61 +667,64 @@ def run_swarm(timeout_minutes: float, check_interval: float) -> dict:
 
 def print_comparison(results: dict):
     """Print a comparison table of all trials."""
-    print("\n" + "=" * 70)
-    print("  BENCHMARK RESULTS")
-    print("=" * 70)
+    log("\n" + "=" * 70)
+    log("  BENCHMARK RESULTS")
+    log("=" * 70)
 
     header = f"  {'Approach':<15} {'Cycles':<12} {'Time':<12} {'Speedup':<12} {'Status'}"
-    print(header)
-    print("  " + "-" * 66)
+    log(header)
+    log("  " + "-" * 66)
 
     for name, data in results.items():
         cycles = data["cycles"]
         time_m = data["time_seconds"] / 60
         speedup = BASELINE / cycles if cycles > 0 else 0
         status = "ERROR" if "error" in data else "OK"
-        print(f"  {name:<15} {cycles:<12} {time_m:<12.1f}m {speedup:<12.2f}x {status}")
+        log(f"  {name:<15} {cycles:<12} {time_m:<12.1f}m {speedup:<12.2f}x {status}")
 
     if len(results) > 1:
-        print()
-        winner = min(results.items(), key=lambda x: x[1]["cycles"])
-        loser = max(results.items(), key=lambda x: x[1]["cycles"])
+        log()
+        # Single pass; on ties the first trial wins (and loses).
+        winner = loser = None
+        for entry in results.items():
+            cycles = entry[1]["cycles"]
+            if winner is None or cycles < winner[1]["cycles"]:
+                winner = entry
+            if loser is None or cycles > loser[1]["cycles"]:
+                loser = entry
 
         winner_name, winner_data = winner
         loser_name, loser_data = loser
 
-        print(f"  Winner: {winner_name} ({winner_data['cycles']} cycles)")
+        log(f"  Winner: {winner_name} ({winner_data['cycles']} cycles)")
         if loser_data["cycles"] > 0 and winner_data["cycles"] > 0:
             relative = loser_data["cycles"] / winner_data["cycles"]
-            print(f"  {winner_name} is {relative:.2f}x better than {loser_name}")
+            log(f"  {winner_name} is {relative:.2f}x better than {loser_name}")
 
         # Time comparison
         if winner_data["time_seconds"] > 0 and loser_data["time_seconds"] > 0:
             time_ratio = loser_data["time_seconds"] / winner_data["time_seconds"]
             if time_ratio > 1:
-                print(f"  {winner_name} was {time_ratio:.1f}x faster in wall time")
+                log(f"  {winner_name} was {time_ratio:.1f}x faster in wall time")
             else:
-                print(f"  {loser_name} was {1/time_ratio:.1f}x faster in wall time")
+                log(f"  {loser_name} was {1/time_ratio:.1f}x faster in wall time")
 
     # Threshold analysis
-    print("\n  Threshold Analysis:")
-    thresholds = [
-        ("Baseline", BASELINE),
-        ("Updated starter", 18532),
-        ("Opus 4 many hours", 2164),
-        ("Opus 4.5 casual (best human 2hr)", 1790),
-        ("Opus 4.5 2hr harness", 1579),
-        ("Sonnet 4.5 many hours", 1548),
-        ("Opus 4.5 11.5hr harness", 1487),
-        ("Opus 4.5 improved harness", 1363),
-    ]
-
+    log("\n  Threshold Analysis:")
     for name, data in results.items():
         cycles = data["cycles"]
-        print(f"\n  {name} ({cycles} cycles):")
-        for thresh_name, thresh_val in thresholds:
+        log(f"\n  {name} ({cycles} cycles):")
+        for thresh_name, thresh_val in THRESHOLDS:
             passed = "PASS" if cycles < thresh_val else "FAIL"
-            print(f"    [{passed}] {thresh_name}: < {thresh_val}")
+            log(f"    [{passed}] {thresh_name}: < {thresh_val}")
+
+
+def persist_results(results: dict, results_file: str):
+    """Write results atomically so readers never see a half-written file."""
+    tmp_file = results_file + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(results, f, indent=2, default=str)
+    os.replace(tmp_file, results_file)
 
 
 # ---------------------------------------------------------------------------
@@ -526,7 +743,7 @@ def main():
     )
     parser.add_argument(
         "--check-interval", type=float, default=30,
-        help="How often to check cycle count, in seconds (default: 30)",
+        help="Longest wait between cycle checks while nothing changes, in seconds (default: 30)",
     )
     parser.add_argument(
         "--single-only", action="store_true",
@@ -536,53 +753,68 @@ def main():
         "--swarm-only", action="store_true",
         help="Only run swarm trial",
     )
+    parser.add_argument(
+        "--sequential", action="store_true",
+        help="Run trials one after another instead of concurrently",
+    )
     args = parser.parse_args()
 
     # Validate environment
     if not os.path.exists(DEBUG_SOCKET):
-        print(f"Error: Debug socket not found: {DEBUG_SOCKET}")
-        print("Make sure jcode server is running with debug_control enabled:")
-        print("  touch ~/.jcode/debug_control")
-        print("  jcode serve")
+        log(f"Error: Debug socket not found: {DEBUG_SOCKET}")
+        log("Make sure jcode server is running with debug_control enabled:")
+        log("  touch ~/.jcode/debug_control")
+        log("  jcode serve")
         sys.exit(1)
 
     if not os.path.exists(TAKEHOME_SOURCE):
-        print(f"Error: Take-home source not found: {TAKEHOME_SOURCE}")
+        log(f"Error: Take-home source not found: {TAKEHOME_SOURCE}")
         sys.exit(1)
 
     os.makedirs(BENCHMARK_DIR, exist_ok=True)
 
-    print("=" * 70)
-    print("  SWARM vs SINGLE-AGENT BENCHMARK")
-    print("=" * 70)
-    print(f"  Timeout:        {args.timeout} minutes per trial")
-    print(f"  Check interval: {args.check_interval} seconds")
-    print(f"  Source:         {TAKEHOME_SOURCE}")
-    print(f"  Baseline:       {BASELINE} cycles")
-    print()
-
+    log("=" * 70)
+    log("  SWARM vs SINGLE-AGENT BENCHMARK")
+    log("=" * 70)
+    log(f"  Timeout:        {args.timeout} minutes per trial")
+    log(f"  Check interval: {args.check_interval} seconds")
+    log(f"  Source:         {TAKEHOME_SOURCE}")
+    log(f"  Baseline:       {BASELINE} cycles")
+    log()
+
+    trials = {}
+    if not args.swarm_only:
+        trials["single"] = run_single_agent
+    if not args.single_only:
+        trials["swarm"] = run_swarm
+
+    # Trials use separate workspaces and sessions and spend their time waiting
+    # on the server, so they can run side by side. Results are persisted as
+    # each trial finishes so an aborted run keeps what it already measured.
+    results_file = os.path.join(BENCHMARK_DIR, "results.json")
     results = {}
-
-    run_single = not args.swarm_only
-    run_multi = not args.single_only
-
-    if run_single:
-        results["single"] = run_single_agent(args.timeout, args.check_interval)
-
-    if run_multi:
-        results["swarm"] = run_swarm(args.timeout, args.check_interval)
+    if args.sequential or len(trials) < 2:
+        for name, trial in trials.items():
+            results[name] = trial(args.timeout, args.check_interval)
+            persist_results(results, results_file)
+    else:
+        with ThreadPoolExecutor(max_workers=len(trials)) as executor:
+            futures = {
+                executor.submit(trial, args.timeout, args.check_interval): name
+                for name, trial in trials.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                persist_results(results, results_file)
+        results = {name: results[name] for name in trials}
 
     if results:
         print_comparison(results)
     else:
-        print("No trials were run.")
-
-    # Write results to JSON
-    results_file = os.path.join(BENCHMARK_DIR, "results.json")
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2, default=str)
-    print(f"\n  Results saved to: {results_file}")
+        log("No trials were run.")
 
+    persist_results(results, results_file)
+    log(f"\n  Results saved to: {results_file}")
 
 if __name__ == "__main__":
     main()
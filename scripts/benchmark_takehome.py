@@ -9,16 +9,28 @@ Usage:
 """
 
 import socket
+import itertools
 import json
 import os
 import sys
 import time
-import select
+import re
 import shutil
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# orjson is optional; it only speeds up debug-socket framing.
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    json_loads = json.loads
+
 DEBUG_SOCKET = f"/run/user/{os.getuid()}/jcode-debug.sock"
 TAKEHOME_SOURCE = os.environ.get(
     "TAKEHOME_SOURCE", str(Path.home() / "original_performance_takehome")
@@ -26,44 +38,90 @@ TAKEHOME_SOURCE = os.environ.get(
 BENCHMARK_DIR = "/tmp/takehome-benchmark"
 TIMEOUT_MINUTES = int(os.environ.get('BENCHMARK_TIMEOUT', '10'))
 BASELINE = 147734
+CYCLES_RE = re.compile(rb"CYCLES:\s*(\d+)")
+
+_print_lock = threading.Lock()
+# Per-thread line prefix, so concurrent runs in `both` mode stay distinguishable.
+_log_ctx = threading.local()
+
+
+def log(*args, **kwargs):
+    """print() that tags lines with the current run and keeps them intact."""
+    prefix = getattr(_log_ctx, 'prefix', None)
+    with _print_lock:
+        if prefix:
+            print(prefix, *args, **kwargs)
+        else:
+            print(*args, **kwargs)
+
+
+_REQ_TEMPLATE = b'{"type":"debug_command","id":%d,"command":%s%s}\n'
+_req_ids = itertools.count(1)
+
+# One persistent debug-socket connection per thread; (sock, file) or None.
+_conn_tls = threading.local()
+
+
+def _close_conn():
+    conn = getattr(_conn_tls, 'conn', None)
+    _conn_tls.conn = None
+    if conn is not None:
+        conn[1].close()
+        conn[0].close()
 
 
 def send_cmd(cmd: str, session_id: str = None, timeout: float = 300) -> tuple:
-    """Send a debug command and get response."""
-    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    sock.connect(DEBUG_SOCKET)
-    sock.setblocking(False)
-
-    req = {"type": "debug_command", "id": 1, "command": cmd}
-    if session_id:
-        req["session_id"] = session_id
-
-    sock.send((json.dumps(req) + '\n').encode())
-
-    start = time.time()
-    data = b""
-    while time.time() - start < timeout:
-        ready, _, _ = select.select([sock], [], [], 1.0)
-        if ready:
-            try:
-                chunk = sock.recv(65536)
-                if not chunk:
-                    break
-                data += chunk
-                if b'\n' in data:
-                    break
-            except BlockingIOError:
-                continue
-
-    sock.close()
+    """Send a debug command and get response.
 
-    if not data:
+    Reuses this thread's connection. If sending on it fails, the server closed
+    it while idle and never saw the command, so it is resent once on a fresh
+    connection. A command that was written is never resent (message_async and
+    create_session are not idempotent); any failure after that drops the
+    connection, since a late reply would be read as the next response.
+    """
+    session = b',"session_id":' + json_dumps(session_id) if session_id else b''
+    payload = _REQ_TEMPLATE % (next(_req_ids), json_dumps(cmd), session)
+
+    for attempt in range(2):
+        conn = getattr(_conn_tls, 'conn', None)
+        try:
+            if conn is None:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                _conn_tls.conn = conn = (sock, sock.makefile('rb'))
+                sock.connect(DEBUG_SOCKET)
+            sock, f = conn
+            sock.settimeout(timeout)
+            # Unbuffered, so a failed send leaves nothing queued for close().
+            sock.sendall(payload)
+        except socket.timeout:
+            _close_conn()
+            return False, "", "Timeout"
+        except OSError:
+            _close_conn()
+            if attempt:
+                raise
+            continue
+        break
+
+    try:
+        # Responses are newline-framed; readline returns as soon as one arrives.
+        data = f.readline()
+    except socket.timeout:
+        _close_conn()
         return False, "", "Timeout"
+    except OSError as e:
+        _close_conn()
+        return False, "", f"Connection error: {e}"
+
+    if not data:
+        _close_conn()
+        return False, "", "Connection closed"
 
     try:
-        resp = json.loads(data.decode().strip())
+        resp = json_loads(data)
         return resp.get('ok', False), resp.get('output', ''), resp.get('error', '')
     except json.JSONDecodeError as e:
+        _close_conn()
         return False, "", f"JSON error: {e}"
 
 
@@ -72,44 +130,149 @@ def create_session(working_dir: str) -> tuple:
     ok, output, err = send_cmd(f"create_session:{working_dir}", timeout=120)
     if not ok:
         raise RuntimeError(f"Failed to create session: {err}")
-    data = json.loads(output)
+    data = json_loads(output)
     return data['session_id'], data.get('friendly_name', data['session_id'][:12])
 
 
-def destroy_session(session_id: str):
+def destroy_session(session_id: str, timeout: float = 300):
     """Destroy a session."""
-    send_cmd(f"destroy_session:{session_id}")
+    send_cmd(f"destroy_session:{session_id}", timeout=timeout)
+
+
+_cleanup_threads = []
+
+
+def destroy_session_in_background(session_id: str):
+    """Destroy a session without blocking the caller on an unresponsive server."""
+    t = threading.Thread(target=destroy_session, args=(session_id, 5), daemon=True)
+    t.start()
+    _cleanup_threads.append(t)
+
+
+def wait_for_cleanup(timeout: float = 5):
+    """Give pending session teardown a bounded chance to finish before exit."""
+    deadline = time.monotonic() + timeout
+    for t in _cleanup_threads:
+        t.join(max(0, deadline - time.monotonic()))
+
+
+# Cleared on the first job_wait:<id>:<secs> a server rejects (older servers
+# only accept job_wait:<id>, with a fixed 15 minute wait).
+_job_wait_supported = True
+
+
+def wait_for_job(job_id: str, session_id: str, seconds: int) -> dict:
+    """Wait up to `seconds` for a job to finish and return its status payload.
+
+    Returns early when the job completes. Returns None if the status could
+    not be read, including when the wait elapsed with the job still running.
+    """
+    global _job_wait_supported
+    if _job_wait_supported:
+        ok, output, _ = send_cmd(f"job_wait:{job_id}:{seconds}", session_id, timeout=seconds + 10)
+        if ok:
+            return json_loads(output)
+        if output.startswith("Timeout waiting for job"):
+            return None
+        _job_wait_supported = False
+        log(f"job_wait unavailable ({output or 'no response'}), polling job_status")
+
+    time.sleep(seconds)
+    ok, output, _ = send_cmd(f"job_status:{job_id}", session_id, timeout=10)
+    if not ok:
+        return None
+    try:
+        return json_loads(output)
+    except json.JSONDecodeError:
+        return None
 
 
 def setup_workspace(name: str) -> str:
-    """Create a clean copy of the take-home."""
+    """Create a clean copy of the take-home.
+
+    Uses a reflink copy where the filesystem supports it (btrfs/xfs share
+    extents until written). Hardlinks are not an option: jcode's edit and
+    write tools rewrite files in place, which would modify the source tree.
+    """
     workspace = os.path.join(BENCHMARK_DIR, name)
-    if os.path.exists(workspace):
-        shutil.rmtree(workspace)
-    shutil.copytree(TAKEHOME_SOURCE, workspace)
+    shutil.rmtree(workspace, ignore_errors=True)
+    result = subprocess.run(
+        ["cp", "-a", "--reflink=auto", TAKEHOME_SOURCE, workspace], capture_output=True
+    )
+    if result.returncode != 0:
+        # Non-GNU cp (e.g. macOS) has no --reflink.
+        shutil.rmtree(workspace, ignore_errors=True)
+        shutil.copytree(TAKEHOME_SOURCE, workspace)
     return workspace
 
 
+# workspace -> (source signature, cycles) from the last test run
+_cycles_cache: dict[str, tuple[tuple, int]] = {}
+
+
+def _source_signature(workspace: str) -> tuple:
+    """Cheap fingerprint of every Python source in the workspace (path, mtime, size).
+
+    Files or directories that vanish mid-walk (e.g. an editor's atomic rename)
+    are skipped; the next poll sees the settled tree.
+    """
+    entries = []
+    stack = [workspace]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((entry.path, st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
 def get_cycles(workspace: str) -> int:
-    """Run tests and return cycle count."""
+    """Run tests and return cycle count.
+
+    Reuses the last result while no Python source in the workspace has changed.
+    """
     try:
+        signature = _source_signature(workspace)
+        cached = _cycles_cache.get(workspace)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         result = subprocess.run(
             ["python", "tests/submission_tests.py", "-v"],
             cwd=workspace,
             capture_output=True,
-            text=True,
             timeout=120
         )
-        for line in (result.stdout + result.stderr).split('\n'):
-            if 'CYCLES:' in line:
-                return int(line.split('CYCLES:')[1].strip())
+        match = CYCLES_RE.search(result.stdout) or CYCLES_RE.search(result.stderr)
+        if match:
+            cycles = int(match.group(1))
+            _cycles_cache[workspace] = (signature, cycles)
+            return cycles
     except Exception as e:
-        print(f"Error getting cycles: {e}")
+        log(f"Error getting cycles: {e}")
     return BASELINE
 
 
-def make_single_prompt(workspace: str) -> str:
-    return f"""You are optimizing a VLIW SIMD kernel for Anthropic's performance take-home.
+# Shared by both prompts so single and swarm start from the same playbook.
+KNOWN_TECHNIQUES = """Known techniques (start here rather than rediscovering them):
+- Unroll the outer loop 4-16x so each bundle has enough independent work to fill its slots
+- Software-pipeline iterations so one group's loads, another's hash stages and a third's stores share bundles
+- Interleave the hash stages of several vectors; each stage depends on the previous one, so a single vector leaves most slots idle
+- Keep constants and loop-invariant vectors in scratch instead of re-broadcasting them every iteration
+"""
+
+SINGLE_PROMPT_TEMPLATE = """You are optimizing a VLIW SIMD kernel for Anthropic's performance take-home.
 
 IMPORTANT: You MUST work in this directory: {workspace}
 All file paths should be relative to or within this directory.
@@ -129,20 +292,41 @@ Key optimizations to try:
 3. Reduce memory access latency - batch loads/stores
 4. Optimize the hash function - it runs many times per element
 
+""" + KNOWN_TECHNIQUES + """
 Start by reading {workspace}/problem.py to understand the machine, then optimize build_kernel().
 After each change, run `cd {workspace} && python tests/submission_tests.py` to check correctness and cycles.
 
 Work efficiently - focus on the highest-impact optimizations first."""
 
 
+SWARM_PROMPT_TEMPLATE = """Optimize the VLIW SIMD kernel in {workspace}/perf_takehome.py to minimize cycle count.
+
+Current baseline: 147,734 cycles. Goal: as low as possible.
+
+The problem:
+- {workspace}/problem.py defines the machine (VLEN=16 vectors, VLIW bundles, slot limits)
+- {workspace}/perf_takehome.py has build_kernel() which needs optimization
+- Run `cd {workspace} && python tests/submission_tests.py` to verify correctness and check cycles
+
+Key optimization strategies:
+1. Vectorization - use VLEN=16 to process 16 elements at once
+2. VLIW packing - bundle independent operations together
+3. Reduce memory latency - batch loads/stores
+4. Optimize hash function - it runs many times per element
+
+""" + KNOWN_TECHNIQUES + """
+Break this into parallel subtasks and spawn agents to work on different optimizations.
+DO NOT modify tests/ folder."""
+
+
 def run_single_agent() -> dict:
     """Run a single agent benchmark using async messaging."""
-    print("\n" + "=" * 60)
-    print(f"SINGLE AGENT BENCHMARK (timeout: {TIMEOUT_MINUTES}m)")
-    print("=" * 60)
+    log("\n" + "=" * 60)
+    log(f"SINGLE AGENT BENCHMARK (timeout: {TIMEOUT_MINUTES}m)")
+    log("=" * 60)
 
     workspace = setup_workspace("single")
-    print(f"Workspace: {workspace}")
+    log(f"Workspace: {workspace}")
 
     start_time = time.time()
     session_id = None
@@ -150,63 +334,64 @@ def run_single_agent() -> dict:
 
     try:
         session_id, name = create_session(workspace)
-        print(f"Session: {name}")
+        log(f"Session: {name}")
 
         # Initial cycles
         cycles = get_cycles(workspace)
-        print(f"Baseline: {cycles} cycles")
+        log(f"Baseline: {cycles} cycles")
 
         # Send optimization task asynchronously
-        print("\nStarting optimization (async)...")
-        prompt = make_single_prompt(workspace)
+        log("\nStarting optimization (async)...")
+        prompt = SINGLE_PROMPT_TEMPLATE.format(workspace=workspace)
 
         # Use message_async to start the job
         ok, output, err = send_cmd(f"message_async:{prompt}", session_id, timeout=30)
         if not ok:
-            print(f"Failed to start async job: {err}")
+            log(f"Failed to start async job: {err}")
             return {"approach": "single", "cycles": BASELINE, "time_seconds": 0, "error": err}
 
-        job_data = json.loads(output)
+        job_data = json_loads(output)
         job_id = job_data.get("job_id")
-        print(f"Job started: {job_id}")
+        log(f"Job started: {job_id}")
 
         timeout_seconds = TIMEOUT_MINUTES * 60
         last_cycles = BASELINE
-        check_interval = 30  # Check every 30 seconds
+        last_signature = _source_signature(workspace)
+        status = None
+        check_interval = 10  # Unchanged kernels skip the test run
 
         while time.time() - start_time < timeout_seconds:
             elapsed = time.time() - start_time
 
-            # Check job status
-            ok, status_output, _ = send_cmd(f"job_status:{job_id}", session_id, timeout=10)
-            if ok:
-                try:
-                    status = json.loads(status_output)
-                    job_status = status.get("status", "unknown")
-                    if job_status in ["completed", "failed"]:
-                        print(f"\n[{elapsed/60:.1f}m] Job {job_status}")
-                        break
-                except:
-                    pass
-
-            # Check current cycles in workspace
+            job_status = status.get("status", "unknown") if status else None
+            if job_status in ["completed", "failed"]:
+                log(f"\n[{elapsed/60:.1f}m] Job {job_status}")
+                break
+
+            # Re-check cycles only once the agent has touched a source file
+            signature = _source_signature(workspace)
+            if signature != last_signature:
+                last_signature = signature
+                cycles = get_cycles(workspace)
+                if cycles < best_cycles:
+                    best_cycles = cycles
+                    log(f"[{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({BASELINE/cycles:.2f}x speedup)")
+                elif cycles != last_cycles:
+                    log(f"[{elapsed/60:.1f}m] Cycles: {cycles}")
+                last_cycles = cycles
+
+            # Block server-side until the job finishes or the interval passes
+            remaining = timeout_seconds - (time.time() - start_time)
+            status = wait_for_job(job_id, session_id, max(1, min(check_interval, int(remaining))))
+
+        # Final check, only if sources changed after the loop last measured them
+        if _source_signature(workspace) != last_signature:
             cycles = get_cycles(workspace)
             if cycles < best_cycles:
                 best_cycles = cycles
-                print(f"[{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({BASELINE/cycles:.2f}x speedup)")
-            elif cycles != last_cycles:
-                print(f"[{elapsed/60:.1f}m] Cycles: {cycles}")
-            last_cycles = cycles
-
-            time.sleep(check_interval)
-
-        # Final check
-        cycles = get_cycles(workspace)
-        if cycles < best_cycles:
-            best_cycles = cycles
 
         elapsed = time.time() - start_time
-        print(f"\nFinal: {best_cycles} cycles in {elapsed/60:.1f}m ({BASELINE/best_cycles:.2f}x)")
+        log(f"\nFinal: {best_cycles} cycles in {elapsed/60:.1f}m ({BASELINE/best_cycles:.2f}x)")
 
         return {
             "approach": "single",
@@ -216,7 +401,7 @@ def run_single_agent() -> dict:
         }
 
     except Exception as e:
-        print(f"Error: {e}")
+        log(f"Error: {e}")
         return {
             "approach": "single",
             "cycles": BASELINE,
@@ -225,7 +410,7 @@ def run_single_agent() -> dict:
         }
     finally:
         if session_id:
-            destroy_session(session_id)
+            destroy_session_in_background(session_id)
 
 
 def run_swarm(n_agents: int = 2) -> dict:
@@ -234,12 +419,12 @@ def run_swarm(n_agents: int = 2) -> dict:
     This uses the full swarm capability where ONE agent becomes coordinator,
     creates a plan, and spawns subagents automatically.
     """
-    print("\n" + "=" * 60)
-    print(f"AUTONOMOUS SWARM BENCHMARK (timeout: {TIMEOUT_MINUTES}m)")
-    print("=" * 60)
+    log("\n" + "=" * 60)
+    log(f"AUTONOMOUS SWARM BENCHMARK (timeout: {TIMEOUT_MINUTES}m)")
+    log("=" * 60)
 
     workspace = setup_workspace("swarm")
-    print(f"Workspace: {workspace}")
+    log(f"Workspace: {workspace}")
 
     start_time = time.time()
     session_id = None
@@ -248,91 +433,75 @@ def run_swarm(n_agents: int = 2) -> dict:
     try:
         # Create ONE session - it becomes coordinator and spawns agents
         session_id, name = create_session(workspace)
-        print(f"Coordinator: {name}")
+        log(f"Coordinator: {name}")
 
         baseline = get_cycles(workspace)
-        print(f"Baseline: {baseline} cycles")
+        log(f"Baseline: {baseline} cycles")
 
         # Use swarm_message_async - this will:
         # 1. Plan subtasks automatically
         # 2. Spawn subagents to work in parallel
         # 3. Integrate results
-        prompt = f"""Optimize the VLIW SIMD kernel in {workspace}/perf_takehome.py to minimize cycle count.
+        prompt = SWARM_PROMPT_TEMPLATE.format(workspace=workspace)
 
-Current baseline: 147,734 cycles. Goal: as low as possible.
-
-The problem:
-- {workspace}/problem.py defines the machine (VLEN=16 vectors, VLIW bundles, slot limits)
-- {workspace}/perf_takehome.py has build_kernel() which needs optimization
-- Run `cd {workspace} && python tests/submission_tests.py` to verify correctness and check cycles
-
-Key optimization strategies:
-1. Vectorization - use VLEN=16 to process 16 elements at once
-2. VLIW packing - bundle independent operations together
-3. Reduce memory latency - batch loads/stores
-4. Optimize hash function - it runs many times per element
-
-Break this into parallel subtasks and spawn agents to work on different optimizations.
-DO NOT modify tests/ folder."""
-
-        print("\nStarting autonomous swarm (swarm_message_async)...")
+        log("\nStarting autonomous swarm (swarm_message_async)...")
         ok, output, err = send_cmd(f"swarm_message_async:{prompt}", session_id, timeout=30)
         if not ok:
-            print(f"Failed to start swarm: {err}")
+            log(f"Failed to start swarm: {err}")
             return {"approach": "swarm", "cycles": BASELINE, "time_seconds": 0, "error": err}
 
-        job_data = json.loads(output)
+        job_data = json_loads(output)
         job_id = job_data.get("job_id")
-        print(f"Swarm job started: {job_id}")
+        log(f"Swarm job started: {job_id}")
 
         timeout_seconds = TIMEOUT_MINUTES * 60
         last_cycles = BASELINE
-        check_interval = 30
+        last_signature = _source_signature(workspace)
+        status = None
+        check_interval = 10
 
         while time.time() - start_time < timeout_seconds:
             elapsed = time.time() - start_time
 
-            # Check job status
-            ok, status_output, _ = send_cmd(f"job_status:{job_id}", session_id, timeout=10)
-            if ok:
-                try:
-                    status = json.loads(status_output)
-                    job_status = status.get("status", "unknown")
-                    if job_status == "completed":
-                        print(f"\n[{elapsed/60:.1f}m] Swarm completed!")
-                        break
-                    elif job_status == "failed":
-                        print(f"\n[{elapsed/60:.1f}m] Swarm failed: {status.get('error', 'unknown')}")
-                        break
-                except:
-                    pass
-
-            # Check swarm members (to see how many agents were spawned)
-            ok, swarm_output, _ = send_cmd("swarm:members", session_id, timeout=10)
-            if ok and elapsed < 60:  # Only print once early on
-                try:
-                    print(f"[{elapsed/60:.1f}m] Swarm: {swarm_output[:100]}...")
-                except:
-                    pass
-
-            # Check current cycles
+            job_status = status.get("status", "unknown") if status else None
+            if job_status == "completed":
+                log(f"\n[{elapsed/60:.1f}m] Swarm completed!")
+                break
+            elif job_status == "failed":
+                log(f"\n[{elapsed/60:.1f}m] Swarm failed: {status.get('error', 'unknown')}")
+                break
+
+            # Check swarm members (to see how many agents were spawned); the
+            # listing is only reported early on, so skip the RPC afterwards.
+            if elapsed < 60:
+                ok, swarm_output, _ = send_cmd("swarm:members", session_id, timeout=10)
+                if ok:
+                    log(f"[{elapsed/60:.1f}m] Swarm: {swarm_output[:100]}...")
+
+            # Re-check cycles only once the agent has touched a source file
+            signature = _source_signature(workspace)
+            if signature != last_signature:
+                last_signature = signature
+                cycles = get_cycles(workspace)
+                if cycles < best_cycles:
+                    best_cycles = cycles
+                    log(f"[{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({BASELINE/cycles:.2f}x)")
+                elif cycles != last_cycles:
+                    log(f"[{elapsed/60:.1f}m] Cycles: {cycles}")
+                last_cycles = cycles
+
+            # Block server-side until the job finishes or the interval passes
+            remaining = timeout_seconds - (time.time() - start_time)
+            status = wait_for_job(job_id, session_id, max(1, min(check_interval, int(remaining))))
+
+        # Final check, only if sources changed after the loop last measured them
+        if _source_signature(workspace) != last_signature:
             cycles = get_cycles(workspace)
             if cycles < best_cycles:
                 best_cycles = cycles
-                print(f"[{elapsed/60:.1f}m] NEW BEST: {cycles} cycles ({BASELINE/cycles:.2f}x)")
-            elif cycles != last_cycles:
-                print(f"[{elapsed/60:.1f}m] Cycles: {cycles}")
-            last_cycles = cycles
-
-            time.sleep(check_interval)
-
-        # Final check
-        cycles = get_cycles(workspace)
-        if cycles < best_cycles:
-            best_cycles = cycles
 
         elapsed = time.time() - start_time
-        print(f"\nFinal: {best_cycles} cycles in {elapsed/60:.1f}m ({BASELINE/best_cycles:.2f}x)")
+        log(f"\nFinal: {best_cycles} cycles in {elapsed/60:.1f}m ({BASELINE/best_cycles:.2f}x)")
 
         return {
             "approach": "swarm",
@@ -342,7 +511,7 @@ DO NOT modify tests/ folder."""
         }
 
     except Exception as e:
-        print(f"Error: {e}")
+        log(f"Error: {e}")
         return {
             "approach": "swarm",
             "cycles": BASELINE,
@@ -351,38 +520,38 @@ DO NOT modify tests/ folder."""
         }
     finally:
         if session_id:
-            destroy_session(session_id)
+            destroy_session_in_background(session_id)
 
 
 def print_results(results: dict):
     """Print comparison table."""
-    print("\n" + "=" * 60)
-    print("RESULTS")
-    print("=" * 60)
-    print(f"{'Approach':<15} {'Cycles':<12} {'Time':<10} {'Speedup':<10}")
-    print("-" * 60)
+    log("\n" + "=" * 60)
+    log("RESULTS")
+    log("=" * 60)
+    log(f"{'Approach':<15} {'Cycles':<12} {'Time':<10} {'Speedup':<10}")
+    log("-" * 60)
 
     for name, data in results.items():
         cycles = data['cycles']
         time_m = data['time_seconds'] / 60
         speedup = BASELINE / cycles
-        print(f"{name:<15} {cycles:<12} {time_m:<10.1f}m {speedup:<10.2f}x")
+        log(f"{name:<15} {cycles:<12} {time_m:<10.1f}m {speedup:<10.2f}x")
 
     if len(results) > 1:
         winner = min(results.items(), key=lambda x: x[1]['cycles'])
-        print(f"\nWinner: {winner[0]} ({winner[1]['cycles']} cycles)")
+        log(f"\nWinner: {winner[0]} ({winner[1]['cycles']} cycles)")
 
 
 def main():
     if len(sys.argv) < 2:
-        print(__doc__)
+        log(__doc__)
         sys.exit(1)
 
     mode = sys.argv[1].lower()
     os.makedirs(BENCHMARK_DIR, exist_ok=True)
 
-    print(f"Benchmark timeout: {TIMEOUT_MINUTES} minutes per approach")
-    print(f"Set BENCHMARK_TIMEOUT env var to change (e.g., BENCHMARK_TIMEOUT=30)")
+    log(f"Benchmark timeout: {TIMEOUT_MINUTES} minutes per approach")
+    log(f"Set BENCHMARK_TIMEOUT env var to change (e.g., BENCHMARK_TIMEOUT=30)")
 
     if mode == "single":
         r = run_single_agent()
@@ -393,16 +562,26 @@ def main():
         print_results({"swarm": r})
 
     elif mode == "both":
-        results = {}
-        results['single'] = run_single_agent()
-        results['swarm'] = run_swarm()
+        # Independent workspaces and sessions, so the two runs can overlap.
+        def tagged(tag, fn):
+            _log_ctx.prefix = f"[{tag}]"
+            return fn()
+
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futs = {
+                "single": ex.submit(tagged, "single", run_single_agent),
+                "swarm": ex.submit(tagged, "swarm", run_swarm),
+            }
+            results = {k: f.result() for k, f in futs.items()}
         print_results(results)
 
     else:
-        print(f"Unknown mode: {mode}")
-        print(__doc__)
+        log(f"Unknown mode: {mode}")
+        log(__doc__)
         sys.exit(1)
 
+    wait_for_cleanup()
+
 
 if __name__ == "__main__":
     main()
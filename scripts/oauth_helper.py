@@ -6,21 +6,37 @@ import json
 import os
 import secrets
 import sys
+import time
 import urllib.parse
-import requests
 
 CLIENT_ID = "9d1c250a-e61b-44d9-88ed-5944d1962f5e"
 AUTHORIZE_URL = "https://claude.ai/oauth/authorize"
 TOKEN_URL = "https://console.anthropic.com/v1/oauth/token"
 REDIRECT_URI = "https://console.anthropic.com/oauth/code/callback"
 SCOPES = "org:create_api_key user:profile user:inference"
+HTTP_TIMEOUT_S = 10
+
+_session = None
+
+def get_session():
+    """Return the shared pooled session so repeated token calls reuse the TLS connection.
+
+    requests is imported here rather than at module scope because the
+    auth-URL path never touches the network.
+    """
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+        _session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2))
+    return _session
 
 def generate_pkce():
     """Generate PKCE verifier and challenge."""
-    verifier = secrets.token_urlsafe(48)[:64]  # 64 chars
-    digest = hashlib.sha256(verifier.encode()).digest()
-    challenge = base64.urlsafe_b64encode(digest).rstrip(b'=').decode()
-    return verifier, challenge
+    verifier = base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b'=')  # 43 chars
+    digest = hashlib.sha256(verifier).digest()
+    challenge = base64.urlsafe_b64encode(digest).rstrip(b'=')
+    return verifier.decode('ascii'), challenge.decode('ascii')
 
 def generate_state():
     """Generate random state for CSRF protection."""
@@ -36,13 +52,13 @@ def main():
             saved = json.load(f)
 
         # Exchange code for tokens
-        resp = requests.post(TOKEN_URL, data={
+        resp = get_session().post(TOKEN_URL, data={
             "grant_type": "authorization_code",
             "client_id": CLIENT_ID,
             "code": code,
             "code_verifier": saved["verifier"],
             "redirect_uri": REDIRECT_URI,
-        })
+        }, timeout=HTTP_TIMEOUT_S)
 
         if resp.status_code != 200:
             print(f"Error: {resp.text}")
@@ -56,7 +72,6 @@ def main():
         creds_dir = os.path.expanduser("~/.claude")
         os.makedirs(creds_dir, exist_ok=True)
 
-        import time
         expires_at = int(time.time() * 1000) + (tokens["expires_in"] * 1000)
 
         creds = {
@@ -67,8 +82,9 @@ def main():
             }
         }
 
-        with open(os.path.join(creds_dir, ".credentials.json"), "w") as f:
-            json.dump(creds, f, indent=2)
+        # Users inspect this file, so keep it indented, but build it in one pass.
+        with open(os.path.join(creds_dir, ".credentials.json"), "wb") as f:
+            f.write(json.dumps(creds, indent=2).encode())
 
         print(f"\nCredentials saved to ~/.claude/.credentials.json")
     else:
@@ -87,13 +103,15 @@ def main():
         }
         auth_url = f"{AUTHORIZE_URL}?{urllib.parse.urlencode(params)}"
 
-        with open("/tmp/claude_oauth_state.json", "w") as f:
-            json.dump({
-                "verifier": verifier,
-                "challenge": challenge,
-                "state": state,
-                "auth_url": auth_url
-            }, f)
+        # Machine-read only: compact separators, one pre-encoded write.
+        state_json = json.dumps({
+            "verifier": verifier,
+            "challenge": challenge,
+            "state": state,
+            "auth_url": auth_url
+        }, separators=(",", ":"))
+        with open("/tmp/claude_oauth_state.json", "wb") as f:
+            f.write(state_json.encode())
 
         print(f"Auth URL: {auth_url}")
         print(f"\nState saved to /tmp/claude_oauth_state.json")